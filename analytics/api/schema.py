@@ -0,0 +1,46 @@
+"""
+OpenAPI schema view serving a schema generated ahead of time.
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+from django.conf import settings
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.response import Response
+
+from config.logger import logger
+
+
+@lru_cache(maxsize=1)
+def load_precomputed_schema() -> Optional[Dict[str, Any]]:
+    """
+    Read the JSON schema written by ``manage.py spectacular`` at build time.
+
+    Returns None when API_SCHEMA_FILE is unset or missing, or under DEBUG
+    (where the code, and so the schema, changes between image builds), in
+    which case the schema is generated per request as before.
+    """
+    schema_file = getattr(settings, "API_SCHEMA_FILE", "")
+    if not schema_file or settings.DEBUG:
+        return None
+    path = Path(schema_file)
+    if not path.is_file():
+        logger.warning("API_SCHEMA_FILE %s not found; generating the schema per request", path)
+        return None
+    return orjson.loads(path.read_bytes())
+
+
+class PrecomputedSpectacularAPIView(SpectacularAPIView):
+    """
+    SpectacularAPIView that returns the precomputed schema when available,
+    skipping endpoint introspection and the postprocessing hooks. The usual
+    YAML/JSON renderers still apply.
+    """
+
+    def get(self, request, *args, **kwargs):
+        schema = load_precomputed_schema()
+        if schema is None:
+            return super().get(request, *args, **kwargs)
+        return Response(schema)
@@ -22,6 +22,11 @@ class Command(BaseCommand):
         self.stdout.write("Setting up Celery Beat periodic tasks...")
 
         # Create interval schedules
+        materialized_view_schedule, _ = IntervalSchedule.objects.get_or_create(
+            every=15,
+            period=IntervalSchedule.MINUTES,
+        )
+
         hourly_schedule, _ = IntervalSchedule.objects.get_or_create(
             every=1,
             period=IntervalSchedule.HOURS,
@@ -102,6 +107,12 @@ class Command(BaseCommand):
                 "schedule": yearly_schedule,
                 "enabled": True,
             },
+            {
+                "name": "Refresh Materialized Views",
+                "task": "analytics.tasks.materialized_views.refresh_materialized_views",
+                "schedule": materialized_view_schedule,
+                "enabled": True,
+            },
         ]
 
         created_count = 0
@@ -0,0 +1,86 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+CREATE_MV_BLOGVIEWS_DAY = [
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_blogviews_day AS
+    SELECT
+        row_number() OVER (ORDER BY day, blog_id) AS id,
+        day,
+        blog_id,
+        views
+    FROM (
+        SELECT date_trunc('day', viewed_at) AS day, blog_id, COUNT(*) AS views
+        FROM analytics_blogview
+        GROUP BY 1, 2
+    ) AS daily
+    """,
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS mv_blogviews_day_day_blog_uniq ON mv_blogviews_day (day, blog_id)",
+    "CREATE INDEX IF NOT EXISTS mv_blogviews_day_blog_day_idx ON mv_blogviews_day (blog_id, day)",
+]
+
+DROP_MV_BLOGVIEWS_DAY = "DROP MATERIALIZED VIEW IF EXISTS mv_blogviews_day"
+
+
+def create_materialized_view(apps, schema_editor):
+    # Materialized views are PostgreSQL-only; other backends fall back to raw queries.
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in CREATE_MV_BLOGVIEWS_DAY:
+            schema_editor.execute(statement)
+
+
+def drop_materialized_view(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_MV_BLOGVIEWS_DAY)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_blog_updated_at_blogview_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogViewDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateTimeField(help_text="Start of the day bucket"),
+                ),
+                (
+                    "views",
+                    models.BigIntegerField(
+                        help_text="Number of views of the blog on this day"
+                    ),
+                ),
+                (
+                    "blog",
+                    models.ForeignKey(
+                        help_text="Viewed blog",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="analytics.blog",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blog View Daily Rollup",
+                "verbose_name_plural": "Blog View Daily Rollups",
+                "db_table": "mv_blogviews_day",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_materialized_view, drop_materialized_view),
+    ]
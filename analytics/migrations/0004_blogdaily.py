@@ -0,0 +1,100 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+CREATE_MV_BLOGS_DAY = [
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_blogs_day AS
+    SELECT
+        row_number() OVER (ORDER BY day, author_id, country_id NULLS FIRST) AS id,
+        day,
+        author_id,
+        country_id,
+        blogs
+    FROM (
+        SELECT date_trunc('day', created_at) AS day, author_id, country_id, COUNT(*) AS blogs
+        FROM analytics_blog
+        GROUP BY 1, 2, 3
+    ) AS daily
+    """,
+    # country_id is nullable, so the unique index required by
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY goes on the synthetic id.
+    "CREATE UNIQUE INDEX IF NOT EXISTS mv_blogs_day_id_uniq ON mv_blogs_day (id)",
+    "CREATE INDEX IF NOT EXISTS mv_blogs_day_day_idx ON mv_blogs_day (day)",
+    "CREATE INDEX IF NOT EXISTS mv_blogs_day_author_day_idx ON mv_blogs_day (author_id, day)",
+    "CREATE INDEX IF NOT EXISTS mv_blogs_day_country_day_idx ON mv_blogs_day (country_id, day)",
+]
+
+DROP_MV_BLOGS_DAY = "DROP MATERIALIZED VIEW IF EXISTS mv_blogs_day"
+
+
+def create_materialized_view(apps, schema_editor):
+    # Materialized views are PostgreSQL-only; other backends fall back to the aggregate tables.
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in CREATE_MV_BLOGS_DAY:
+            schema_editor.execute(statement)
+
+
+def drop_materialized_view(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_MV_BLOGS_DAY)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0003_blogviewdaily"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateTimeField(help_text="Start of the day bucket"),
+                ),
+                (
+                    "blogs",
+                    models.BigIntegerField(
+                        help_text="Number of blogs created on this day"
+                    ),
+                ),
+                (
+                    "author",
+                    models.ForeignKey(
+                        help_text="Author of the created blogs",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="analytics.author",
+                    ),
+                ),
+                (
+                    "country",
+                    models.ForeignKey(
+                        help_text="Country of the created blogs",
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="analytics.country",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blog Creation Daily Rollup",
+                "verbose_name_plural": "Blog Creation Daily Rollups",
+                "db_table": "mv_blogs_day",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_materialized_view, drop_materialized_view),
+    ]
@@ -0,0 +1,190 @@
+from django.db import migrations, models
+
+
+# Each roll-up keeps the TOP_ROLLUP_SIZE (100) most viewed entries, ranked by id,
+# and is built from the per-blog daily rollup rather than raw blog views.
+TOP_ROLLUPS = {
+    "mv_top_blog_alltime": """
+        SELECT b.title AS x, b.id AS y, SUM(d.views) AS z
+        FROM mv_blogviews_day d
+        JOIN analytics_blog b ON b.id = d.blog_id
+        GROUP BY b.id, b.title
+    """,
+    "mv_top_user_alltime": """
+        SELECT u.username AS x, u.id AS y, SUM(d.views) AS z
+        FROM mv_blogviews_day d
+        JOIN analytics_blog b ON b.id = d.blog_id
+        JOIN analytics_author a ON a.id = b.author_id
+        JOIN auth_user u ON u.id = a.user_id
+        GROUP BY u.id, u.username
+    """,
+    "mv_top_country_alltime": """
+        SELECT
+            COALESCE(NULLIF(c.name, ''), c.code) AS x,
+            COUNT(DISTINCT d.blog_id) AS y,
+            SUM(d.views) AS z
+        FROM mv_blogviews_day d
+        JOIN analytics_blog b ON b.id = d.blog_id
+        LEFT JOIN analytics_country c ON c.id = b.country_id
+        GROUP BY 1
+    """,
+}
+
+TOP_ROLLUP_SIZE = 100
+
+
+def create_materialized_views(apps, schema_editor):
+    # Materialized views are PostgreSQL-only; other backends fall back to raw queries.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for view_name, select in TOP_ROLLUPS.items():
+        schema_editor.execute(
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS {view_name} AS
+            SELECT row_number() OVER (ORDER BY z DESC, y) AS id, x, y, z
+            FROM ({select}) AS totals
+            ORDER BY z DESC, y
+            LIMIT {TOP_ROLLUP_SIZE}
+            """
+        )
+        # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+        schema_editor.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {view_name}_id_uniq ON {view_name} (id)"
+        )
+
+
+def drop_materialized_views(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for view_name in TOP_ROLLUPS:
+            schema_editor.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0004_blogdaily"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TopBlogAllTime",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "x",
+                    models.CharField(
+                        help_text="Label of the ranked entry",
+                        max_length=255,
+                        null=True,
+                    ),
+                ),
+                (
+                    "y",
+                    models.BigIntegerField(
+                        help_text="Entry id, or distinct blogs for countries"
+                    ),
+                ),
+                (
+                    "z",
+                    models.BigIntegerField(help_text="Total views"),
+                ),
+            ],
+            options={
+                "verbose_name": "Top Blog (All Time)",
+                "verbose_name_plural": "Top Blogs (All Time)",
+                "db_table": "mv_top_blog_alltime",
+                "ordering": ["id"],
+                "managed": False,
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="TopUserAllTime",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "x",
+                    models.CharField(
+                        help_text="Label of the ranked entry",
+                        max_length=255,
+                        null=True,
+                    ),
+                ),
+                (
+                    "y",
+                    models.BigIntegerField(
+                        help_text="Entry id, or distinct blogs for countries"
+                    ),
+                ),
+                (
+                    "z",
+                    models.BigIntegerField(help_text="Total views"),
+                ),
+            ],
+            options={
+                "verbose_name": "Top User (All Time)",
+                "verbose_name_plural": "Top Users (All Time)",
+                "db_table": "mv_top_user_alltime",
+                "ordering": ["id"],
+                "managed": False,
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="TopCountryAllTime",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "x",
+                    models.CharField(
+                        help_text="Label of the ranked entry",
+                        max_length=255,
+                        null=True,
+                    ),
+                ),
+                (
+                    "y",
+                    models.BigIntegerField(
+                        help_text="Entry id, or distinct blogs for countries"
+                    ),
+                ),
+                (
+                    "z",
+                    models.BigIntegerField(help_text="Total views"),
+                ),
+            ],
+            options={
+                "verbose_name": "Top Country (All Time)",
+                "verbose_name_plural": "Top Countries (All Time)",
+                "db_table": "mv_top_country_alltime",
+                "ordering": ["id"],
+                "managed": False,
+                "abstract": False,
+            },
+        ),
+        migrations.RunPython(create_materialized_views, drop_materialized_views),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+# Expression indexes matching the SQL Django emits for Trunc*("viewed_at") on
+# PostgreSQL with TIME_ZONE = "UTC": DATE_TRUNC(<kind>, viewed_at AT TIME ZONE 'UTC').
+# The AT TIME ZONE cast makes the expression IMMUTABLE, which date_trunc on a
+# timestamptz alone is not, so it can be indexed.
+TRUNC_INDEXES = {
+    f"analytics_blogview_{kind}_idx": (
+        f"(date_trunc('{kind}', viewed_at AT TIME ZONE 'UTC'))"
+    )
+    for kind in ("day", "week", "month", "year")
+}
+
+# Range seeks on viewed_at per blog (blog/user filters plus a date range)
+TRUNC_INDEXES["analytics_blogview_blog_viewed_idx"] = "(blog_id, viewed_at)"
+
+
+def create_indexes(apps, schema_editor):
+    # Built CONCURRENTLY so the blog view table stays writable; PostgreSQL only.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, columns in TRUNC_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON analytics_blogview {columns}"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRUNC_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("analytics", "0005_top_alltime_rollups"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
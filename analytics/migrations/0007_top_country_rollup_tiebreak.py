@@ -0,0 +1,58 @@
+from django.db import migrations
+
+
+# The country roll-up breaks ties on views by the country label, like the
+# live top country query (its y is a blog count, not an id), so both rank the
+# same rows and keep the same TOP_ROLLUP_SIZE entries.
+COUNTRY_TOTALS = """
+    SELECT
+        COALESCE(NULLIF(c.name, ''), c.code) AS x,
+        COUNT(DISTINCT d.blog_id) AS y,
+        SUM(d.views) AS z
+    FROM mv_blogviews_day d
+    JOIN analytics_blog b ON b.id = d.blog_id
+    LEFT JOIN analytics_country c ON c.id = b.country_id
+    GROUP BY 1
+"""
+
+TOP_ROLLUP_SIZE = 100
+
+
+def _recreate_country_rollup(schema_editor, order_by):
+    # Materialized views are PostgreSQL-only; other backends fall back to raw queries.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP MATERIALIZED VIEW IF EXISTS mv_top_country_alltime")
+    schema_editor.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_top_country_alltime AS
+        SELECT row_number() OVER (ORDER BY {order_by}) AS id, x, y, z
+        FROM ({COUNTRY_TOTALS}) AS totals
+        ORDER BY {order_by}
+        LIMIT {TOP_ROLLUP_SIZE}
+        """
+    )
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    schema_editor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS mv_top_country_alltime_id_uniq "
+        "ON mv_top_country_alltime (id)"
+    )
+
+
+def order_by_label(apps, schema_editor):
+    _recreate_country_rollup(schema_editor, "z DESC, x ASC NULLS LAST")
+
+
+def order_by_blog_count(apps, schema_editor):
+    _recreate_country_rollup(schema_editor, "z DESC, y")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0006_blogview_trunc_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(order_by_label, order_by_blog_count),
+    ]
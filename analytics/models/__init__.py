@@ -11,6 +11,13 @@ from .aggregation import (
     BlogViewTimeSeriesAggregate,
     BlogCreationTimeSeriesAggregate,
 )
+from .materialized import (
+    BlogViewDaily,
+    BlogDaily,
+    TopBlogAllTime,
+    TopUserAllTime,
+    TopCountryAllTime,
+)
 
 __all__ = [
     "Country",
@@ -20,5 +27,10 @@ __all__ = [
     "TimeSeriesGranularity",
     "BlogViewTimeSeriesAggregate",
     "BlogCreationTimeSeriesAggregate",
+    "BlogViewDaily",
+    "BlogDaily",
+    "TopBlogAllTime",
+    "TopUserAllTime",
+    "TopCountryAllTime",
 ]
 
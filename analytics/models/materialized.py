@@ -0,0 +1,127 @@
+"""
+Read-only models backed by PostgreSQL materialized views.
+
+These models are unmanaged: the views are created by migrations (PostgreSQL only)
+and refreshed periodically by Celery, so reads against them may be slightly stale.
+"""
+from django.db import models
+from .author import Author
+from .blog import Blog
+from .country import Country
+
+
+class BlogViewDaily(models.Model):
+    """
+    Blog views rolled up per blog per day (materialized view ``mv_blogviews_day``).
+
+    Keeping the blog in the grain lets callers roll days up to week/month/year
+    buckets while still counting distinct blogs exactly.
+    """
+    day = models.DateTimeField(help_text="Start of the day bucket")
+    blog = models.ForeignKey(
+        Blog,
+        on_delete=models.DO_NOTHING,
+        related_name="+",
+        help_text="Viewed blog",
+    )
+    views = models.BigIntegerField(help_text="Number of views of the blog on this day")
+
+    class Meta:
+        managed = False
+        db_table = "mv_blogviews_day"
+        verbose_name = "Blog View Daily Rollup"
+        verbose_name_plural = "Blog View Daily Rollups"
+
+    def __str__(self):
+        return f"{self.day:%Y-%m-%d} - blog {self.blog_id} - {self.views} views"
+
+
+class BlogDaily(models.Model):
+    """
+    Blog creations rolled up per author, country and day (materialized view ``mv_blogs_day``).
+    """
+    day = models.DateTimeField(help_text="Start of the day bucket")
+    author = models.ForeignKey(
+        Author,
+        on_delete=models.DO_NOTHING,
+        related_name="+",
+        help_text="Author of the created blogs",
+    )
+    country = models.ForeignKey(
+        Country,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        related_name="+",
+        help_text="Country of the created blogs",
+    )
+    blogs = models.BigIntegerField(help_text="Number of blogs created on this day")
+
+    class Meta:
+        managed = False
+        db_table = "mv_blogs_day"
+        verbose_name = "Blog Creation Daily Rollup"
+        verbose_name_plural = "Blog Creation Daily Rollups"
+
+    def __str__(self):
+        return f"{self.day:%Y-%m-%d} - author {self.author_id} - {self.blogs} blogs"
+
+
+# Number of ranked rows kept in each all-time top roll-up
+TOP_ROLLUP_SIZE = 100
+
+
+class TopAllTime(models.Model):
+    """
+    Base for all-time top-N roll-ups, already in the top analytics x/y/z shape.
+
+    ``id`` is the rank (1 = most viewed).
+    """
+    x = models.CharField(max_length=255, null=True, help_text="Label of the ranked entry")
+    y = models.BigIntegerField(help_text="Entry id, or distinct blogs for countries")
+    z = models.BigIntegerField(help_text="Total views")
+
+    class Meta:
+        abstract = True
+        managed = False
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"#{self.id} {self.x} - {self.z} views"
+
+
+class TopBlogAllTime(TopAllTime):
+    """Most viewed blogs (materialized view ``mv_top_blog_alltime``)."""
+
+    class Meta(TopAllTime.Meta):
+        db_table = "mv_top_blog_alltime"
+        verbose_name = "Top Blog (All Time)"
+        verbose_name_plural = "Top Blogs (All Time)"
+
+
+class TopUserAllTime(TopAllTime):
+    """Most viewed authors' users (materialized view ``mv_top_user_alltime``)."""
+
+    class Meta(TopAllTime.Meta):
+        db_table = "mv_top_user_alltime"
+        verbose_name = "Top User (All Time)"
+        verbose_name_plural = "Top Users (All Time)"
+
+
+class TopCountryAllTime(TopAllTime):
+    """Most viewed countries (materialized view ``mv_top_country_alltime``)."""
+
+    class Meta(TopAllTime.Meta):
+        db_table = "mv_top_country_alltime"
+        verbose_name = "Top Country (All Time)"
+        verbose_name_plural = "Top Countries (All Time)"
+
+
+# Materialized views refreshed by analytics.tasks.materialized_views.
+# Order matters: the top roll-ups are built from mv_blogviews_day.
+MATERIALIZED_VIEW_MODELS = (
+    BlogViewDaily,
+    BlogDaily,
+    TopBlogAllTime,
+    TopUserAllTime,
+    TopCountryAllTime,
+)
@@ -1,7 +1,16 @@
 """
 Custom pagination classes for analytics API.
 """
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from django.core.paginator import InvalidPage
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from config.settings import get_secret
 
 # Read pagination settings from environment variables
@@ -41,3 +50,148 @@ class ConfigurablePageNumberPagination(PageNumberPagination):
     max_page_size = _MAX_PAGE_SIZE
     page_query_param = "page"
 
+    def get_limit_offset(self, request) -> Tuple[int, int]:
+        """
+        LIMIT/OFFSET for the requested page, for services that page in the database.
+
+        Invalid page numbers map to offset 0 here and are rejected by
+        ``paginate_counted``.
+        """
+        page_size = self.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except (TypeError, ValueError):
+            page_number = 1
+        return page_size, max(page_number - 1, 0) * page_size
+
+    def paginate_counted(self, rows: List[Any], count: int, request) -> List[Any]:
+        """
+        Paginate rows that were already sliced in the database.
+
+        ``count`` is the total number of rows across all pages; it drives the
+        page validation and the next/previous links of ``get_paginated_response``.
+        """
+        self.request = request
+        paginator = self.django_paginator_class(range(count), self.get_page_size(request))
+        # No "last" shortcut: the offset was computed before the count was known
+        page_number = request.query_params.get(self.page_query_param) or 1
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+        self.page.object_list = rows
+        return rows
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset (seek) pagination.
+
+    The service fetches one row more than the page size; if that extra row
+    comes back there is a next page, addressed by the position of the last
+    row on this page rather than by an offset. The response keeps the
+    count/next/previous/results shape of the page number pagination, with
+    ``count`` being the number of rows on this page.
+    """
+    cursor_query_param = "after"
+    limit_query_param = "limit"
+
+    @staticmethod
+    def encode_cursor(position: Tuple[Any, ...]) -> str:
+        """Opaque, URL-safe cursor for a row position."""
+        return base64.urlsafe_b64encode(orjson.dumps(list(position))).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+        """
+        Decode a cursor produced by ``encode_cursor``.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            position = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (binascii.Error, UnicodeEncodeError, orjson.JSONDecodeError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if not isinstance(position, list) or len(position) != 2:
+            raise ValueError("Invalid cursor")
+        return tuple(position)
+
+    def paginate_rows(self, rows: List[Dict[str, Any]], limit: int, request) -> List[Dict[str, Any]]:
+        """Trim the look-ahead row and remember whether another page exists."""
+        self.request = request
+        self.has_next = len(rows) > limit
+        self.page = rows[:limit]
+        return self.page
+
+    def get_next_cursor(self, position: Optional[Tuple[Any, ...]]) -> Optional[str]:
+        if not self.has_next or position is None:
+            return None
+        return self.encode_cursor(position)
+
+    def get_paginated_response(self, data: List[Any], next_cursor: Optional[str]) -> Response:
+        url = self.request.build_absolute_uri()
+        if next_cursor is None:
+            next_link = None
+        else:
+            # A page number has no meaning next to a cursor
+            next_link = replace_query_param(
+                remove_query_param(url, "page"), self.cursor_query_param, next_cursor
+            )
+        return Response({
+            "count": len(data),
+            "next": next_link,
+            "previous": None,
+            "next_cursor": next_cursor,
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["count", "results"],
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "example": 10,
+                },
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                },
+                "next_cursor": {
+                    "type": "string",
+                    "nullable": True,
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {
+                    "type": "integer",
+                },
+            },
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor for the next page, taken from next_cursor.",
+                "schema": {
+                    "type": "string",
+                },
+            },
+        ]
@@ -0,0 +1,22 @@
+"""
+Custom parsers for analytics API.
+"""
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class ORJSONParser(BaseParser):
+    """
+    JSON parser backed by orjson.
+
+    Drop-in for DRF's JSONParser; request bodies are expected to be UTF-8,
+    as the JSON spec requires.
+    """
+    media_type = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,23 @@
+"""
+Custom renderers for analytics API.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Encodes ``Response.data`` in C, including datetimes, dates and UUIDs;
+    anything else orjson does not know (e.g. Decimal, lazy strings) falls
+    back to ``str``.
+    """
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=str)
@@ -1,20 +1,161 @@
 """
 Serializers for Top Analytics endpoint.
 """
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+
 from rest_framework import serializers
-from analytics.serializers.common import DateRangeSerializer, FilterSerializer
+from analytics.pagination import KeysetPagination
+from analytics.serializers.common import (
+    DateRangeSerializer,
+    FilterSerializer,
+    validate_filter_structure,
+)
+
+TOP_CHOICES = ("user", "country", "blog")
+MAX_TOP_LIMIT = 100
 
 
 class TopAnalyticsRequestSerializer(DateRangeSerializer, FilterSerializer):
-    """Request serializer for top analytics."""
+    """
+    Request serializer for top analytics.
+
+    Used for the OpenAPI schema; requests are validated by the equivalent
+    TopAnalyticsRequest below.
+    """
     top = serializers.ChoiceField(
-        choices=["user", "country", "blog"],
+        choices=list(TOP_CHOICES),
         default="blog",
         help_text="Type of top analytics to retrieve"
     )
+    limit = serializers.IntegerField(
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=MAX_TOP_LIMIT,
+        help_text="Number of top results per page"
+    )
+    after = serializers.CharField(
+        required=False,
+        allow_null=True,
+        help_text="Cursor from the previous page's next_cursor"
+    )
 
     class Meta:
-        fields = ["top", "filters", "start", "end"]
+        fields = ["top", "filters", "start", "end", "limit", "after"]
+
+    def validate_after(self, value):
+        """Decode the cursor into a (views, key) position."""
+        if not value:
+            return None
+        try:
+            return KeysetPagination.decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+
+def _parse_date(value: Any, field: str, errors: Dict[str, list]) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        errors[field] = ["Date has wrong format. Use one of these formats instead: YYYY-MM-DD."]
+        return None
+
+
+def _valid_position(top: str, position: Tuple[Any, ...]) -> bool:
+    """
+    Whether a decoded cursor is a (views, key) pair of the right types:
+    the key is the blog/user id, or the country label (None for blogs
+    without a country).
+    """
+    views, key = position
+
+    def is_int(value: Any) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    if not is_int(views):
+        return False
+    if top == "country":
+        return key is None or isinstance(key, str)
+    return is_int(key)
+
+
+@dataclass(slots=True, frozen=True)
+class TopAnalyticsRequest:
+    """
+    Validated top analytics request.
+
+    Same rules and error shape as TopAnalyticsRequestSerializer, checked inline
+    instead of through DRF's per-field machinery on this hot endpoint.
+    """
+    top: str = "blog"
+    filters: Optional[Dict[str, Any]] = None
+    start: Optional[date] = None
+    end: Optional[date] = None
+    limit: int = 10
+    after: Optional[Tuple[Any, ...]] = None
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "TopAnalyticsRequest":
+        """
+        Build a request from parsed query params.
+
+        Raises:
+            serializers.ValidationError: With a {field: [message]} mapping
+        """
+        errors: Dict[str, list] = {}
+
+        top = data.get("top") or "blog"
+        if top not in TOP_CHOICES:
+            errors["top"] = [f'"{top}" is not a valid choice.']
+
+        filters = data.get("filters")
+        if filters is not None:
+            if not isinstance(filters, dict):
+                errors["filters"] = [f'Expected a dictionary of items but got type "{type(filters).__name__}".']
+            else:
+                try:
+                    validate_filter_structure(filters)
+                except ValueError as e:
+                    errors["filters"] = [str(e)]
+
+        start = _parse_date(data.get("start"), "start", errors)
+        end = _parse_date(data.get("end"), "end", errors)
+
+        limit = data.get("limit")
+        if limit is None:
+            limit = 10
+        else:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                errors["limit"] = ["A valid integer is required."]
+            else:
+                if not 1 <= limit <= MAX_TOP_LIMIT:
+                    errors["limit"] = [f"Ensure this value is between 1 and {MAX_TOP_LIMIT}."]
+
+        after = data.get("after")
+        if after:
+            try:
+                after = KeysetPagination.decode_cursor(after)
+            except ValueError as e:
+                errors["after"] = [str(e)]
+            else:
+                if "top" not in errors and not _valid_position(top, after):
+                    errors["after"] = ["Invalid cursor"]
+        else:
+            after = None
+
+        if not errors and start and end and start > end:
+            errors["end"] = ["End date must be after start date."]
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return cls(top=top, filters=filters, start=start, end=end, limit=limit, after=after)
 
 
 class TopAnalyticsResponseSerializer(serializers.Serializer):
@@ -5,7 +5,7 @@ from typing import List, Dict, Any
 from django.db.models import Count
 from django.db.models.functions import TruncDate
 from analytics.models import BlogView
-from analytics.utils.filters import build_q_from_filter
+from analytics.utils.filters import cached_q_from_filter, has_meaningful_filters
 from analytics.utils.helpers import parse_timerange, TRUNC_MAP
 
 
@@ -34,11 +34,11 @@ class TimeSeriesService:
         if granularity not in TRUNC_MAP:
             raise ValueError(f"Invalid granularity: {granularity}. Must be one of: {list(TRUNC_MAP.keys())}")
         
-        view_qs = BlogView.objects.select_related("blog__author", "blog__country")
+        view_qs = BlogView.objects.all()
         
         # Apply dynamic filters if provided
-        if filters:
-            q = build_q_from_filter(filters)
+        if has_meaningful_filters(filters):
+            q = cached_q_from_filter(filters)
             view_qs = view_qs.filter(q)
         
         # Apply time range to the view timestamp
@@ -4,10 +4,16 @@ Service for Blog Views Analytics business logic.
 
 from __future__ import annotations
 from typing import List, Dict, Any, Callable, Optional
-from django.db.models import Count, F, QuerySet
-from analytics.models import BlogView
-from analytics.utils.filters import build_q_from_filter
-from analytics.utils.helpers import parse_timerange, detect_granularity, TRUNC_MAP
+from django.db.models import Aggregate, Count, F, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce, NullIf
+from analytics.models import BlogView, BlogViewDaily
+from analytics.utils.filters import cached_q_from_filter, has_meaningful_filters
+from analytics.utils.helpers import (
+    TRUNC_MAP,
+    detect_granularity,
+    materialized_views_enabled,
+    parse_timerange,
+)
 from config.logger import logger
 
 
@@ -22,15 +28,42 @@ def format_period(dt, granularity: str) -> str:
     return dt.strftime("%Y")  # year
 
 
+# Grouping spec per object type, built once at import time.
+ANALYTICS_CONFIG: Dict[str, Dict[str, Any]] = {
+    "country": {
+        "group_fields": {
+            "country_label": Coalesce(
+                NullIf(F("blog__country__name"), Value("")),
+                F("blog__country__code"),
+                Value("Unknown"),
+            ),
+        },
+        "label": lambda country_label: country_label,
+    },
+    "user": {
+        "group_fields": {"author_username": F("blog__author__user__username"), "author_id": F("blog__author__user__id")},
+        "label": lambda username, author_id: f"{username or 'unknown'} ({author_id})",
+    },
+}
+
+
 class BlogViewsAnalyticsService:
     """Service class for blog views analytics business logic."""
 
     # Base queryset
     @staticmethod
     def _base_queryset() -> QuerySet:
-        return BlogView.objects.select_related(
-            "blog", "blog__author", "blog__author__user", "blog__country"
-        )
+        # Aggregation only: the joins needed by the group fields are added by the ORM
+        return BlogView.objects.all()
+
+    # Pre-aggregated daily rollup (PostgreSQL materialized view)
+    @staticmethod
+    def _use_daily_rollup(filters: Optional[Dict[str, Any]]) -> bool:
+        """
+        Dynamic filters address BlogView fields, so only unfiltered requests
+        can be answered from the per-blog daily rollup.
+        """
+        return not has_meaningful_filters(filters) and materialized_views_enabled()
 
     # Apply filters + time range
     @staticmethod
@@ -40,9 +73,9 @@ class BlogViewsAnalyticsService:
         start: Optional[str],
         end: Optional[str],
     ) -> QuerySet:
-        if filters:
-            qs = qs.filter(build_q_from_filter(filters))
-            logger.debug(f"Filters applied. Remaining rows: {qs.count()}")
+        if has_meaningful_filters(filters):
+            qs = qs.filter(cached_q_from_filter(filters))
+            logger.debug("Filters applied: %s", filters)
         qs = parse_timerange(qs, start, end, datetime_field="viewed_at")
         return qs
 
@@ -51,23 +84,30 @@ class BlogViewsAnalyticsService:
     def _aggregate(
         qs: QuerySet,
         group_fields: Dict[str, F],
-        label_builder: Callable[[Dict[str, Any]], str],
+        label_builder: Callable[..., str],
         granularity: str,
+        datetime_field: str = "viewed_at",
+        views_aggregate: Optional[Aggregate] = None,
     ) -> List[Dict[str, Any]]:
         trunc_func = TRUNC_MAP[granularity]
-        annotated = qs.annotate(time_period=trunc_func("viewed_at"), **group_fields)
+        annotated = qs.annotate(time_period=trunc_func(datetime_field), **group_fields)
         grouped = (
             annotated.values(*group_fields.keys(), "time_period")
-            .annotate(number_of_blogs=Count("blog", distinct=True), total_views=Count("id"))
+            .annotate(
+                number_of_blogs=Count("blog", distinct=True),
+                total_views=views_aggregate or Count("id"),
+            )
             .order_by("time_period", "-total_views")
+            .values_list(*group_fields.keys(), "time_period", "number_of_blogs", "total_views")
         )
+        # Rows are positional tuples: (*group values, time_period, number_of_blogs, total_views)
         return [
             {
-                "x": f"{label_builder(row)} - {format_period(row['time_period'], granularity)}",
-                "y": row["number_of_blogs"],
-                "z": row["total_views"],
+                "x": f"{label_builder(*group)} - {format_period(time_period, granularity)}",
+                "y": number_of_blogs,
+                "z": total_views,
             }
-            for row in grouped
+            for *group, time_period, number_of_blogs, total_views in grouped.iterator(chunk_size=500)
         ]
 
     # Generic analytics handler
@@ -78,27 +118,29 @@ class BlogViewsAnalyticsService:
         start: Optional[str],
         end: Optional[str],
     ) -> List[Dict[str, Any]]:
-        logger.debug(f"Generic analytics for type={object_type}")
-        qs = BlogViewsAnalyticsService._base_queryset()
-        qs = BlogViewsAnalyticsService._apply_filters(qs, filters, start, end)
-        granularity = detect_granularity(start, end)
-
-        CONFIG = {
-            "country": {
-                "group_fields": {"country_code": F("blog__country__code"), "country_name": F("blog__country__name")},
-                "label": lambda row: row.get("country_name") or row.get("country_code") or "Unknown",
-            },
-            "user": {
-                "group_fields": {"author_username": F("blog__author__user__username"), "author_id": F("blog__author__user__id")},
-                "label": lambda row: f"{row.get('author_username') or 'unknown'} ({row.get('author_id')})",
-            },
-        }
-
-        if object_type not in CONFIG:
+        logger.debug("Generic analytics for type=%s", object_type)
+        if object_type not in ANALYTICS_CONFIG:
             raise ValueError(f"Invalid analytics type: {object_type}")
 
-        cfg = CONFIG[object_type]
-        return BlogViewsAnalyticsService._aggregate(qs, cfg["group_fields"], cfg["label"], granularity)
+        granularity = detect_granularity(start, end)
+        if BlogViewsAnalyticsService._use_daily_rollup(filters):
+            logger.debug("Reading blog views from the daily rollup")
+            qs = parse_timerange(BlogViewDaily.objects.all(), start, end, datetime_field="day")
+            datetime_field, views_aggregate = "day", Sum("views")
+        else:
+            qs = BlogViewsAnalyticsService._base_queryset()
+            qs = BlogViewsAnalyticsService._apply_filters(qs, filters, start, end)
+            datetime_field, views_aggregate = "viewed_at", Count("id")
+
+        cfg = ANALYTICS_CONFIG[object_type]
+        return BlogViewsAnalyticsService._aggregate(
+            qs,
+            cfg["group_fields"],
+            cfg["label"],
+            granularity,
+            datetime_field=datetime_field,
+            views_aggregate=views_aggregate,
+        )
 
     # Public API
     @staticmethod
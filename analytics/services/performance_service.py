@@ -4,21 +4,70 @@ Service for Performance Analytics business logic using Time Series Aggregates.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
-from django.db.models import Sum, QuerySet
+from typing import List, Dict, Any, Optional, Tuple
+from django.db import connection
+from django.db.models import CharField, F, QuerySet, Value
 from datetime import datetime
 from django.db.models import Model
 
 
+from analytics.models import BlogDaily, BlogViewDaily
 from analytics.models.aggregation import (
     BlogViewTimeSeriesAggregate,
     BlogCreationTimeSeriesAggregate,
     TimeSeriesGranularity,
 )
-from analytics.utils.helpers import safe_int
+from analytics.utils.cache import cached_analytics
+from analytics.utils.helpers import TRUNC_MAP, materialized_views_enabled, safe_int
 from config.logger import logger
 
 
+# Sums the tagged view/blog rows into one row per period and computes the
+# period-over-period growth with LAG, applying the same rules as ``_growth``
+# (first period → 0.0). Rows come back in the final {x, y, z} shape: the label
+# is built in SQL and totals/growth are cast so they arrive as plain int/float.
+# Growth and the total period count are computed before the optional page
+# LIMIT/OFFSET applies, so a page needs no second query.
+PERFORMANCE_SQL = """
+WITH series AS ({series_sql}),
+periods AS (
+    SELECT
+        time_bucket,
+        CAST(SUM(CASE WHEN kind = 'v' THEN total ELSE 0 END) AS BIGINT) AS views,
+        CAST(SUM(CASE WHEN kind = 'b' THEN total ELSE 0 END) AS BIGINT) AS blogs
+    FROM series
+    GROUP BY time_bucket
+)
+SELECT
+    {period_label} || ' (' || blogs || ' blogs)' AS x,
+    views AS y,
+    CAST(
+        CASE
+            WHEN prev_views IS NULL THEN 0.0
+            WHEN prev_views = 0 THEN CASE WHEN views > 0 THEN 100.0 END
+            ELSE (views - prev_views) * 100.0 / prev_views
+        END AS DOUBLE PRECISION
+    ) AS z,
+    COUNT(*) OVER () AS total_periods
+FROM (
+    SELECT
+        time_bucket,
+        views,
+        blogs,
+        LAG(views) OVER (ORDER BY time_bucket) AS prev_views
+    FROM periods
+) AS ordered_periods
+ORDER BY time_bucket
+{page_clause}"""
+
+# YYYY-MM-DD rendering of the period bucket per database vendor. Other backends
+# return datetimes as ISO text, so the date is its first ten characters.
+PERIOD_LABEL_SQL = {
+    "postgresql": "to_char(time_bucket, 'YYYY-MM-DD')",
+}
+DEFAULT_PERIOD_LABEL_SQL = "substr(time_bucket, 1, 10)"
+
+
 class PerformanceAnalyticsService:
     """Service class for performance analytics using time series aggregates."""
 
@@ -29,8 +78,8 @@ class PerformanceAnalyticsService:
 
     @staticmethod
     def _base_queryset(model: Model, granularity: str) -> QuerySet:
-        qs = model.objects.filter(granularity=granularity).select_related("blog", "author", "country")
-        return qs
+        # Count-only reads: no related rows are needed, so no joins
+        return model.objects.filter(granularity=granularity)
 
 
     @staticmethod
@@ -56,20 +105,6 @@ class PerformanceAnalyticsService:
 
         return PerformanceAnalyticsService._growth(previous, current if current is not None else 0)
 
-    @staticmethod
-    def _compute_growth_series(values: list[int | float]) -> list[float | None]:
-        """
-        Compute growth percentages for an entire list of values.
-        """
-        growth_list: list[float | None] = []
-        prev: float | int | None = None
-
-        for curr in values:
-            growth_list.append(PerformanceAnalyticsService._growth(prev, curr))
-            prev = curr
-
-        return growth_list
-
     # ----------------------------------------------------------------------
     # Helpers
     # ----------------------------------------------------------------------
@@ -82,31 +117,6 @@ class PerformanceAnalyticsService:
             raise ValueError(f"Invalid ISO date: {date_str}")
 
 
-    @staticmethod
-    def _build_result_rows(view_data: QuerySet, blog_counts: Dict[datetime, int]) -> List[Dict[str, Any]]:
-        rows: List[Dict[str, Any]] = []
-        for item in view_data:
-            bucket = item["time_bucket"]
-            views = item["total_views"]
-            blog_count = blog_counts.get(bucket, 0)
-
-            # Format label
-            bucket_label = bucket.strftime("%Y-%m-%d")
-            x_label = f"{bucket_label} ({blog_count} blogs)"
-
-            rows.append({"x": x_label, "y": views})
-
-        # Growth calculation (clean new version)
-        values = [row["y"] for row in rows]
-        growth_values = PerformanceAnalyticsService._compute_growth_series(values)
-
-        if growth_values:
-            growth_values[0] = 0.0
-
-        for row, growth in zip(rows, growth_values):
-            row["z"] = growth
-        return rows
-
     @staticmethod
     def _apply_filters(
         qs: QuerySet,
@@ -140,25 +150,42 @@ class PerformanceAnalyticsService:
 
         return qs
 
-    # ----------------------------------------------------------------------
-    # Main API
-    # ----------------------------------------------------------------------
     @staticmethod
-    def get_performance_analytics(
-        compare: str = "month",
-        filters: Optional[Dict[str, Any]] = None,
-        user_id: Optional[int] = None,
-        start: Optional[str] = None,
-        end: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    def _period_series(compare: str, granularity: str) -> QuerySet:
         """
-        Get performance analytics using time-series aggregate tables.
+        View and blog creation rows keyed by period, tagged by kind ("v"/"b").
 
-        Returns rows:
-            x → label (period + blog count)
-            y → total views
-            z → growth percentage
+        Rows are passed through unaggregated in a single UNION ALL so that
+        PERFORMANCE_SQL sums both series in one GROUP BY on the period.
+
+        Reads the daily materialized views when enabled (rolled up to the
+        requested period at query time), otherwise the time series aggregate
+        tables for that granularity.
         """
+        if materialized_views_enabled():
+            trunc_func = TRUNC_MAP[compare]
+            view_data = BlogViewDaily.objects.values(
+                time_bucket=trunc_func("day"), kind=Value("v", output_field=CharField()), total=F("views")
+            )
+            blog_data = BlogDaily.objects.values(
+                time_bucket=trunc_func("day"), kind=Value("b", output_field=CharField()), total=F("blogs")
+            )
+        else:
+            view_data = PerformanceAnalyticsService._base_queryset(
+                BlogViewTimeSeriesAggregate, granularity
+            ).values("time_bucket", kind=Value("v", output_field=CharField()), total=F("view_count"))
+            blog_data = PerformanceAnalyticsService._base_queryset(
+                BlogCreationTimeSeriesAggregate, granularity
+            ).values("time_bucket", kind=Value("b", output_field=CharField()), total=F("blog_count"))
+        return view_data.order_by().union(blog_data.order_by(), all=True)
+
+    @staticmethod
+    def _fetch_rows(
+        compare: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Run the windowed performance query; returns (rows, total period count)."""
 
         # Supported granularities
         granularity_map = {
@@ -173,42 +200,77 @@ class PerformanceAnalyticsService:
 
         granularity = granularity_map[compare]
 
-        # Base aggregated views queryset
-        view_qs = BlogViewTimeSeriesAggregate.objects.filter(granularity=granularity)
-        blog_qs = BlogCreationTimeSeriesAggregate.objects.filter(granularity=granularity)
-
-        # Apply filters
-        view_qs = PerformanceAnalyticsService._base_queryset(BlogViewTimeSeriesAggregate, granularity)
-        blog_qs = PerformanceAnalyticsService._base_queryset(BlogCreationTimeSeriesAggregate, granularity)
+        series = PerformanceAnalyticsService._period_series(compare, granularity)
+        series_sql, params = series.query.sql_with_params()
+        params = list(params)
 
-        logger.debug(f"View queryset: {view_qs.count()}")
-        logger.debug(f"Blog queryset: {blog_qs.count()}")
+        page_clause = ""
+        if limit is not None:
+            page_clause = "LIMIT %s OFFSET %s\n"
+            params += [limit, offset]
 
-        # Aggregate view counts by time period
-        view_data = (
-            view_qs.values("time_bucket")
-            .annotate(total_views=Sum("view_count"))
-            .order_by("time_bucket")
-        )
-
-        # Aggregate blog creation counts by time period
-        blog_data = (
-            blog_qs.values("time_bucket")
-            .annotate(total_blogs=Sum("blog_count"))
-            .order_by("time_bucket")
+        sql = PERFORMANCE_SQL.format(
+            series_sql=series_sql,
+            period_label=PERIOD_LABEL_SQL.get(connection.vendor, DEFAULT_PERIOD_LABEL_SQL),
+            page_clause=page_clause,
         )
+        # Rows arrive already ordered by period: consume the cursor in one pass.
+        # Every row carries the same total; an empty result (or a page past the end) has none.
+        rows: List[Dict[str, Any]] = []
+        count = 0
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for x, y, z, count in cursor:
+                rows.append({"x": x, "y": y, "z": z})
+        return rows, count
 
+    # ----------------------------------------------------------------------
+    # Main API
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def get_performance_analytics(
+        compare: str = "month",
+        filters: Optional[Dict[str, Any]] = None,
+        user_id: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get performance analytics for every period, unpaginated.
 
-        logger.debug(f"View data: {view_data.count()}")
-        logger.debug(f"Blog data: {blog_data.count()}")
+        Returns rows:
+            x → label (period + blog count)
+            y → total views
+            z → growth percentage
+        """
+        rows, _ = PerformanceAnalyticsService.get_performance_page(
+            compare=compare,
+            filters=filters,
+            user_id=user_id,
+            start=start,
+            end=end,
+            limit=None,
+        )
+        return rows
 
-        # Fast lookup dictionary
-        blog_counts = {
-            row["time_bucket"]: row["total_blogs"]
-            for row in blog_data
-        }
+    @staticmethod
+    @cached_analytics("perf_page")
+    def get_performance_page(
+        compare: str = "month",
+        filters: Optional[Dict[str, Any]] = None,
+        user_id: Optional[int] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        One page of performance analytics, sliced in the database
+        (every period when ``limit`` is None).
 
-        # Build result rows
-        rows = PerformanceAnalyticsService._build_result_rows(view_data, blog_counts)
-        logger.debug(f"Rows: {rows}")
-        return rows
+        Returns the page rows (same shape as ``get_performance_analytics``)
+        and the total number of periods across all pages.
+        """
+        rows, count = PerformanceAnalyticsService._fetch_rows(compare, limit=limit, offset=offset)
+        logger.debug("Rows: %s", rows)
+        return rows, count
@@ -2,19 +2,75 @@
 Service for Top Analytics business logic.
 """
 
-from typing import List, Dict, Any, Callable
-from django.db.models import Count, F, QuerySet
-from analytics.models import BlogView
-from analytics.utils.filters import build_q_from_filter
-from analytics.utils.helpers import parse_timerange
+from typing import List, Dict, Any, Optional, Tuple
+from django.db.models import Count, F, Q, QuerySet, Value
+from django.db.models.functions import Coalesce, NullIf
+from analytics.models import BlogView, TopBlogAllTime, TopCountryAllTime, TopUserAllTime
+from analytics.utils.aggregates import ApproxCountDistinct
+from analytics.utils.cache import cached_analytics
+from analytics.utils.filters import cached_q_from_filter, has_meaningful_filters
+from analytics.utils.helpers import (
+    approx_distinct_enabled,
+    materialized_views_enabled,
+    parse_timerange,
+)
 from config.logger import logger
 
 
+# Aggregation spec per top type, built once at import time.
+# Expressions are resolved (copied) per query, so sharing them is safe.
+TOP_CONFIG: Dict[str, Dict[str, Any]] = {
+    "country": {
+        "values": {
+            # Country name, falling back to the code when the name is blank
+            "x": Coalesce(
+                NullIf(F("blog__country__name"), Value("")),
+                F("blog__country__code"),
+            ),
+        },
+        "annotate": {
+            "z": Count("id"),
+            "y": Count("blog_id", distinct=True),
+        },
+        # Same ranking with the distinct blog count estimated by HyperLogLog
+        "approx_annotate": {
+            "z": Count("id"),
+            "y": ApproxCountDistinct("blog_id"),
+        },
+        "rollup": TopCountryAllTime,
+        # y is a count here, so ties on views are broken by the country label
+        "tiebreak": "x",
+    },
+    "blog": {
+        "values": {
+            "x": F("blog__title"),
+            "y": F("blog__id"),
+        },
+        "annotate": {
+            "z": Count("id"),
+        },
+        "rollup": TopBlogAllTime,
+        "tiebreak": "y",
+    },
+    "user": {
+        "values": {
+            "x": F("blog__author__user__username"),
+            "y": F("blog__author__user__id"),
+        },
+        "annotate": {
+            "z": Count("id"),
+        },
+        "rollup": TopUserAllTime,
+        "tiebreak": "y",
+    },
+}
+
+
 class TopAnalyticsService:
     """Service class for top analytics business logic."""
 
     # -------------------------------------------------------------------------
-    # WRAPPER: Build Base QuerySet (filters + datetime + select_related)
+    # WRAPPER: Build Base QuerySet (filters + datetime)
     # -------------------------------------------------------------------------
     @staticmethod
     def _base_queryset(
@@ -22,16 +78,13 @@ class TopAnalyticsService:
         start: str | None,
         end: str | None,
     ) -> QuerySet:
-        qs = BlogView.objects.select_related(
-            "blog",
-            "blog__author",
-            "blog__country",
-            "blog__author__user",
-        )
+        # Aggregation only: the joins needed by values()/filters are added by the ORM
+        qs = BlogView.objects.all()
 
-        if filters:
-            qs = qs.filter(build_q_from_filter(filters))
+        if has_meaningful_filters(filters):
+            qs = qs.filter(cached_q_from_filter(filters))
 
+        # Whole days, so the end date is inclusive
         qs = parse_timerange(qs, start, end, datetime_field="viewed_at")
         return qs
 
@@ -40,44 +93,65 @@ class TopAnalyticsService:
     # -------------------------------------------------------------------------
     @staticmethod
     def _get_config(top_type: str) -> Dict[str, Any]:
-        config = {
-            "country": {
-                "values": {
-                    "x_code": F("blog__country__code"),
-                    "x_name": F("blog__country__name"),
-                },
-                "annotate": {
-                    "z": Count("id"),
-                    "y": Count("blog_id", distinct=True),
-                },
-                "resolve_x": lambda r: r["x_name"] or r["x_code"],
-            },
-            "blog": {
-                "values": {
-                    "x": F("blog__title"),
-                    "y": F("blog__id"),
-                },
-                "annotate": {
-                    "z": Count("id"),
-                },
-                "resolve_x": lambda r: r["x"],
-            },
-            "user": {
-                "values": {
-                    "x_username": F("blog__author__user__username"),
-                    "y": F("blog__author__user__id"),
-                },
-                "annotate": {
-                    "z": Count("id"),
-                },
-                "resolve_x": lambda r: r["x_username"],
-            },
-        }
-
-        if top_type not in config:
-            raise ValueError(f"Invalid top_type: {top_type}")
-
-        return config[top_type]
+        try:
+            return TOP_CONFIG[top_type]
+        except KeyError:
+            raise ValueError(f"Invalid top analytics type: {top_type}")
+
+    # -------------------------------------------------------------------------
+    # WRAPPER: All-time roll-up eligibility
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _use_rollup(
+        filters: Dict[str, Any] | None,
+        start: str | None,
+        end: str | None,
+    ) -> bool:
+        """
+        Unfiltered, unbounded requests are served from the precomputed
+        all-time top-N materialized views.
+
+        Only the request's own parameters decide this (not the cursor or the
+        page size), so every page of a cursor walk reads the same source: a
+        walk that starts on the roll-up's counts is never continued on live
+        counts, which would skip or repeat rows whose views changed since the
+        last refresh. A roll-up walk ends after its TOP_ROLLUP_SIZE entries.
+        """
+        return (
+            start is None
+            and end is None
+            and not has_meaningful_filters(filters)
+            and materialized_views_enabled()
+        )
+
+    # -------------------------------------------------------------------------
+    # WRAPPER: Keyset seek
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _seek(
+        qs: QuerySet,
+        tiebreak: str,
+        after: Optional[Tuple[int, Any]],
+    ) -> QuerySet:
+        """
+        Order by (z DESC, tiebreak ASC NULLS LAST) and skip everything up to
+        and including the ``after`` position, so deep pages cost the same as
+        the first one instead of scanning the skipped rows.
+
+        NULLS LAST is spelled out because backends disagree on the default
+        (SQLite sorts NULLs first); the seek predicate relies on it.
+        """
+        qs = qs.order_by("-z", F(tiebreak).asc(nulls_last=True))
+        if after is None:
+            return qs
+
+        views, key = after
+        if key is None:
+            # A NULL key is the last row of its views group
+            return qs.filter(z__lt=views)
+        # NULL keys of the same views group still follow a non-NULL key
+        later_in_group = Q(**{f"{tiebreak}__gt": key}) | Q(**{f"{tiebreak}__isnull": True})
+        return qs.filter(Q(z__lt=views) | (Q(z=views) & later_in_group))
 
     # -------------------------------------------------------------------------
     # WRAPPER: Execute aggregation queryset
@@ -87,24 +161,23 @@ class TopAnalyticsService:
         qs: QuerySet,
         values: Dict[str, Any],
         annotate: Dict[str, Any],
+        tiebreak: str,
         limit: int,
+        after: Optional[Tuple[int, Any]] = None,
     ) -> QuerySet:
-        return (
-            qs.values(**values)
-            .annotate(**annotate)
-            .order_by("-z")[:limit]
-        )
+        # GROUP BY, ORDER BY and LIMIT stay in one SELECT so PostgreSQL ranks
+        # the groups with a bounded top-N heapsort instead of a full sort.
+        agg_qs = qs.values(**values).annotate(**annotate)
+        return TopAnalyticsService._seek(agg_qs, tiebreak, after).values_list("x", "y", "z")[:limit]
 
     # -------------------------------------------------------------------------
-    # WRAPPER: Serialize one row
+    # WRAPPER: Cursor position of a result row
     # -------------------------------------------------------------------------
     @staticmethod
-    def _serialize_row(row: Dict[str, Any], resolve_x: Callable) -> Dict[str, Any]:
-        return {
-            "x": resolve_x(row),
-            "y": row.get("y"),
-            "z": row["z"],
-        }
+    def cursor_position(top_type: str, row: Dict[str, Any]) -> Tuple[int, Any]:
+        """(views, tiebreak key) of a row, to be passed back as ``after``."""
+        cfg = TopAnalyticsService._get_config(top_type)
+        return row["z"], row[cfg["tiebreak"]]
 
     # -------------------------------------------------------------------------
     # UNIFIED HANDLER
@@ -116,41 +189,47 @@ class TopAnalyticsService:
         start: str | None = None,
         end: str | None = None,
         limit: int = 10,
+        after: Optional[Tuple[int, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        qs = TopAnalyticsService._base_queryset(filters, start, end)
         cfg = TopAnalyticsService._get_config(top_type)
-        
 
-        agg_qs = TopAnalyticsService._aggregate(
-            qs,
-            values=cfg["values"],
-            annotate=cfg["annotate"],
-            limit=limit,
-        )
+        if TopAnalyticsService._use_rollup(filters, start, end):
+            logger.debug("Reading top %s from the all-time roll-up", top_type)
+            # Ranked with the live tiebreak, so the cursor seeks the same way
+            rollup_qs = TopAnalyticsService._seek(cfg["rollup"].objects.all(), cfg["tiebreak"], after)
+            agg_qs = rollup_qs.values_list("x", "y", "z")[:limit]
+        else:
+            qs = TopAnalyticsService._base_queryset(filters, start, end)
+            annotate = cfg["annotate"]
+            if "approx_annotate" in cfg and approx_distinct_enabled():
+                annotate = cfg["approx_annotate"]
+            agg_qs = TopAnalyticsService._aggregate(
+                qs,
+                values=cfg["values"],
+                annotate=annotate,
+                tiebreak=cfg["tiebreak"],
+                limit=limit,
+                after=after,
+            )
 
-        return [
-            TopAnalyticsService._serialize_row(row, cfg["resolve_x"])
-            for row in agg_qs
-        ]
+        return [{"x": x, "y": y, "z": z} for x, y, z in agg_qs]
 
 
     @staticmethod
+    @cached_analytics("top", local=True)
     def get_top_analytics(
         top: str,
         filters: Dict[str, Any] | None = None,
         start: str | None = None,
         end: str | None = None,
         limit: int = 10,
+        after: Optional[Tuple[int, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        if top in ("country", "blog", "user"):
-            return TopAnalyticsService.get_top_generic(
-                top_type=top,
-                filters=filters,
-                start=start,
-                end=end,
-                limit=limit,
-            )
-
-        raise ValueError(f"Invalid top analytics type: {top}")
-
-  
\ No newline at end of file
+        return TopAnalyticsService.get_top_generic(
+            top_type=top,
+            filters=filters,
+            start=start,
+            end=end,
+            limit=limit,
+            after=after,
+        )
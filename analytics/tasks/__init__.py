@@ -11,6 +11,7 @@ from .aggregation import (  # noqa: F401
     aggregate_blog_creations_monthly,
     aggregate_blog_creations_yearly,
 )
+from .materialized_views import refresh_materialized_views  # noqa: F401
 
 # Import legacy shim so that alias task names like
 # 'apps.analytics.tasks.time_series_aggregation.aggregate_blog_views_hourly'
@@ -30,5 +31,6 @@ __all__ = [
     "aggregate_blog_creations_daily",
     "aggregate_blog_creations_monthly",
     "aggregate_blog_creations_yearly",
+    "refresh_materialized_views",
 ]
 
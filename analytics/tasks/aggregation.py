@@ -25,6 +25,7 @@ from analytics.models.aggregation import (
     BlogCreationTimeSeriesAggregate,
     TimeSeriesGranularity,
 )
+from analytics.utils.cache import bump_generation
 
 
 def get_time_trunc_func(granularity: str):
@@ -121,6 +122,8 @@ def _aggregate_blog_views(granularity: str) -> int:
         f"Completed {granularity} blog views aggregation: "
         f"{created_count} aggregates created/updated"
     )
+    if created_count:
+        bump_generation()
     return created_count
 
 
@@ -160,6 +163,8 @@ def _aggregate_blog_creations(granularity: str) -> int:
         f"Completed {granularity} blog creations aggregation: "
         f"{created_count} aggregates created/updated"
     )
+    if created_count:
+        bump_generation()
     return created_count
 
 
@@ -0,0 +1,32 @@
+"""
+Celery tasks for refreshing PostgreSQL materialized views.
+"""
+from celery import shared_task
+from django.db import connection
+
+from config.logger import logger
+
+from analytics.models.materialized import MATERIALIZED_VIEW_MODELS
+from analytics.utils.cache import bump_generation
+
+
+@shared_task
+def refresh_materialized_views():
+    """
+    Refresh every analytics materialized view.
+
+    Uses REFRESH ... CONCURRENTLY (backed by each view's unique index) so
+    readers are never blocked while the view is rebuilt.
+    """
+    if connection.vendor != "postgresql":
+        logger.info("Skipping materialized view refresh on %s backend", connection.vendor)
+        return 0
+
+    with connection.cursor() as cursor:
+        for model in MATERIALIZED_VIEW_MODELS:
+            view_name = model._meta.db_table
+            logger.info("Refreshing materialized view %s", view_name)
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}")
+
+    bump_generation()
+    return len(MATERIALIZED_VIEW_MODELS)
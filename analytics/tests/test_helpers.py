@@ -0,0 +1,41 @@
+"""
+Unit tests for analytics helpers.
+"""
+from datetime import datetime
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from analytics.models import Author, Blog, BlogView, Country
+from analytics.utils.helpers import parse_timerange
+
+
+class ParseTimerangeTest(TestCase):
+    """Test cases for parse_timerange."""
+
+    def setUp(self):
+        """Set up one view per timestamp around the requested range."""
+        user = User.objects.create_user(username="user", password="testpass123")
+        country = Country.objects.create(code="US", name="United States", continent="North America")
+        blog = Blog.objects.create(title="Blog", author=Author.objects.create(user=user), country=country)
+        self.views = {}
+        for label, moment in {
+            "before": datetime(2023, 6, 14, 23, 59),
+            "start": datetime(2023, 6, 15, 0, 0),
+            "end": datetime(2024, 6, 15, 23, 0),
+            "after": datetime(2024, 6, 16, 0, 0),
+        }.items():
+            view = BlogView.objects.create(blog=blog, user=user)
+            # viewed_at is auto_now_add, so set it after creation
+            BlogView.objects.filter(pk=view.pk).update(viewed_at=timezone.make_aware(moment))
+            self.views[label] = view.pk
+
+    def test_range_includes_both_days_only(self):
+        """Test that the range covers exactly the requested days, not whole buckets."""
+        qs = parse_timerange(BlogView.objects.all(), "2023-06-15", "2024-06-15")
+
+        self.assertEqual(
+            set(qs.values_list("pk", flat=True)),
+            {self.views["start"], self.views["end"]},
+        )
@@ -3,7 +3,8 @@ Unit tests for analytics services.
 """
 from django.test import TestCase
 from django.contrib.auth.models import User
-from analytics.models import Country, Blog, BlogView, Author
+from analytics.models import Country, Blog, BlogView, Author, BlogCreationTimeSeriesAggregate
+from analytics.models.aggregation import BlogViewTimeSeriesAggregate, TimeSeriesGranularity
 from analytics.services.blog_services import BlogViewsAnalyticsService
 from analytics.services.top_service import TopAnalyticsService
 from analytics.services.performance_service import PerformanceAnalyticsService
@@ -139,9 +140,69 @@ class TopAnalyticsServiceTest(TestCase):
     def test_get_top_analytics_country(self):
         """Test get_top_analytics with country type."""
         result = TopAnalyticsService.get_top_analytics("country", limit=10)
-        
+
         self.assertIsInstance(result, list)
 
+    def test_get_top_analytics_after_cursor(self):
+        """Test that the after cursor resumes the ranking past the given row."""
+        first = TopAnalyticsService.get_top_analytics("blog", limit=1)
+        after = TopAnalyticsService.cursor_position("blog", first[0])
+        second = TopAnalyticsService.get_top_analytics("blog", limit=1, after=after)
+
+        self.assertEqual(first[0]["y"], self.blog1.id)
+        self.assertEqual(second[0]["y"], self.blog2.id)
+
+    def _walk(self, top):
+        """Page through a ranking one row at a time with the after cursor."""
+        rows, after = [], None
+        for _ in range(10):
+            page = TopAnalyticsService.get_top_analytics(top, limit=1, after=after)
+            if not page:
+                break
+            rows.extend(page)
+            after = TopAnalyticsService.cursor_position(top, page[-1])
+        return rows
+
+    def _add_blog(self, username, country, views):
+        user = User.objects.create_user(username=username, password="testpass123")
+        blog = Blog.objects.create(
+            title=f"{username} blog",
+            author=Author.objects.create(user=user),
+            country=country,
+        )
+        for _ in range(views):
+            BlogView.objects.create(blog=blog, user=user)
+        return user
+
+    def test_after_cursor_walk_user(self):
+        """Test that walking the user ranking by cursor visits each user once, ties by id."""
+        user3 = self._add_blog("user3", self.country, 2)
+
+        rows = self._walk("user")
+
+        self.assertEqual(rows, TopAnalyticsService.get_top_analytics("user", limit=10))
+        self.assertEqual([row["y"] for row in rows], [self.user1.id, self.user2.id, user3.id])
+
+    def test_after_cursor_walk_country(self):
+        """Test that walking the country ranking by cursor handles ties and a NULL country."""
+        ethiopia = Country.objects.create(code="ET", name="Ethiopia", continent="Africa")
+        self._add_blog("user3", ethiopia, 2)
+        self._add_blog("user4", None, 2)
+
+        rows = self._walk("country")
+
+        self.assertEqual(rows, TopAnalyticsService.get_top_analytics("country", limit=10))
+        self.assertEqual(
+            [(row["x"], row["z"]) for row in rows],
+            [("United States", 7), ("Ethiopia", 2), (None, 2)],
+        )
+
+    def test_base_queryset_has_no_joins(self):
+        """Test that the unfiltered base queryset does not join related tables."""
+        qs = TopAnalyticsService._base_queryset(None, None, None)
+
+        self.assertNotIn("JOIN", str(qs.query))
+
 
 class PerformanceAnalyticsServiceTest(TestCase):
     """Test cases for PerformanceAnalyticsService."""
@@ -205,6 +266,66 @@ class PerformanceAnalyticsServiceTest(TestCase):
         
         self.assertIsInstance(result, list)
 
+    def _seed_monthly_aggregates(self):
+        """
+        Five monthly periods of view/blog aggregates:
+        first period, growth, drop to zero, zero to zero, zero to non-zero.
+        """
+        month = TimeSeriesGranularity.MONTH
+
+        def bucket(m):
+            return timezone.make_aware(datetime(2024, m, 1))
+
+        for m, blog, views in ((1, self.blog, 6), (1, None, 4), (2, self.blog, 15), (5, self.blog, 8)):
+            BlogViewTimeSeriesAggregate.objects.create(
+                granularity=month, time_bucket=bucket(m), blog=blog, view_count=views
+            )
+        for m, author, blogs in ((1, self.author, 2), (3, self.author, 1), (4, self.author, 1)):
+            BlogCreationTimeSeriesAggregate.objects.create(
+                granularity=month, time_bucket=bucket(m), author=author, blog_count=blogs
+            )
+
+    def test_get_performance_analytics_growth(self):
+        """Test labels, view totals and growth computed by the windowed query."""
+        self._seed_monthly_aggregates()
+
+        result = PerformanceAnalyticsService.get_performance_analytics("month")
+
+        self.assertEqual(
+            result,
+            [
+                # First period: no previous period, reported as 0.0
+                {"x": "2024-01-01 (2 blogs)", "y": 10, "z": 0.0},
+                {"x": "2024-02-01 (0 blogs)", "y": 15, "z": 50.0},
+                {"x": "2024-03-01 (1 blogs)", "y": 0, "z": -100.0},
+                # Zero to zero has no growth
+                {"x": "2024-04-01 (1 blogs)", "y": 0, "z": None},
+                # Zero to non-zero counts as 100%
+                {"x": "2024-05-01 (0 blogs)", "y": 8, "z": 100.0},
+            ],
+        )
+
+    def test_get_performance_page(self):
+        """Test that a database-sliced page keeps growth from earlier rows and the total count."""
+        self._seed_monthly_aggregates()
+
+        rows, count = PerformanceAnalyticsService.get_performance_page("month", limit=2, offset=1)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(
+            rows,
+            [
+                {"x": "2024-02-01 (0 blogs)", "y": 15, "z": 50.0},
+                {"x": "2024-03-01 (1 blogs)", "y": 0, "z": -100.0},
+            ],
+        )
+
+    def test_base_queryset_has_no_joins(self):
+        """Test that the aggregate-table base queryset does not join related tables."""
+        qs = PerformanceAnalyticsService._base_queryset(BlogCreationTimeSeriesAggregate, "month")
+
+        self.assertNotIn("JOIN", str(qs.query))
+
     def test_get_performance_analytics_invalid_compare(self):
         """Test that invalid compare value raises ValueError."""
         with self.assertRaises(ValueError):
@@ -5,9 +5,11 @@ import json
 from urllib.parse import quote
 from django.test import TestCase
 from django.contrib.auth.models import User
+from drf_spectacular.validation import validate_schema
 from rest_framework.test import APIClient
 from rest_framework import status
 from analytics.models import Country, Blog, BlogView, Author
+from analytics.pagination import KeysetPagination
 from datetime import datetime, timedelta
 from django.utils import timezone
 
@@ -182,6 +184,38 @@ class TopAnalyticsViewTest(TestCase):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_top_analytics_not_modified(self):
+        """Test that a matching If-None-Match gets an empty 304."""
+        url = "/analytics/top/?top=blog"
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_top_analytics_invalid_cursor(self):
+        """Test top analytics endpoint with a malformed after cursor."""
+        url = "/analytics/top/?top=blog&after=not-a-cursor"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("after", response.data)
+
+    def test_top_analytics_cursor_wrong_types(self):
+        """Test that well-formed cursors with the wrong value types are rejected."""
+        for top, position in (
+            ("blog", [1, {"a": 1}]),
+            ("user", [None, 1]),
+            ("country", [5, 7]),
+        ):
+            cursor = KeysetPagination.encode_cursor(position)
+            response = self.client.get(f"/analytics/top/?top={top}&after={quote(cursor)}")
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("after", response.data)
+
     def test_top_analytics_pagination(self):
         """Test that top analytics response is paginated."""
         url = "/analytics/top/?top=blog"
@@ -298,3 +332,27 @@ class PerformanceAnalyticsViewTest(TestCase):
         self.assertIn("previous", response.data)
         self.assertIn("results", response.data)
 
+
+
+class SchemaViewTest(TestCase):
+    """Test cases for the OpenAPI schema endpoint."""
+
+    def setUp(self):
+        """Set up test client."""
+        self.client = APIClient()
+
+    def test_schema_generation(self):
+        """Test that the schema generates, including the keyset paginated endpoint."""
+        response = self.client.get("/api/schema/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Same check as the image build step (manage.py spectacular --validate)
+        validate_schema(response.data)
+        operations = {
+            operation["operationId"]: operation
+            for path in response.data["paths"].values()
+            for operation in path.values()
+        }
+        parameters = {p["name"] for p in operations["top_analytics"]["parameters"]}
+        self.assertIn("after", parameters)
+        self.assertIn("limit", parameters)
@@ -0,0 +1,17 @@
+"""
+Custom aggregate expressions used by analytics services.
+"""
+from django.db.models import Aggregate, BigIntegerField
+
+
+class ApproxCountDistinct(Aggregate):
+    """
+    Approximate COUNT(DISTINCT ...) using a HyperLogLog sketch.
+
+    Requires the PostgreSQL ``hll`` extension (``CREATE EXTENSION hll``);
+    only use it when ``approx_distinct_enabled()`` is true.
+    """
+    function = "hll_add_agg"
+    name = "ApproxCountDistinct"
+    template = "CAST(ROUND(hll_cardinality(%(function)s(hll_hash_bigint(%(expressions)s)))) AS BIGINT)"
+    output_field = BigIntegerField()
@@ -0,0 +1,141 @@
+"""
+Result caching for analytics services.
+
+Service results are cached in the default Django cache (Redis outside tests),
+keyed by a hash of the call arguments. Hot endpoints can add the per-process
+"local" cache (LocMemCache, LRU + TTL) in front of it.
+
+Keys carry a data generation that the aggregation and materialized view
+refresh tasks bump once they have written new data. Old entries are never
+deleted; they stop being addressed and expire on their own.
+
+The generation only covers results read from the time series aggregate
+tables and the materialized views: performance analytics, and the
+unfiltered blog views and all-time top rankings served from roll-ups.
+Results computed from raw BlogView rows (filtered or date-bounded top and
+blog views analytics) are not versioned by it and rely on the TTL alone.
+"""
+import hashlib
+import inspect
+import time
+from functools import wraps
+from typing import Any, Callable, Dict
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache, caches
+
+from config.logger import logger
+
+
+def analytics_cache_enabled() -> bool:
+    """Caching follows USE_REDIS_CACHE and is always off under tests."""
+    return getattr(settings, "USE_REDIS_CACHE", True) and not getattr(settings, "IS_TESTING", False)
+
+
+GENERATION_KEY = "analytics:views:gen"
+
+
+def get_generation() -> int:
+    """
+    Current analytics data generation.
+
+    Memoized in the per-process "local" cache for
+    ANALYTICS_GENERATION_CACHE_TIMEOUT seconds, so local result cache hits do
+    not need a shared cache round trip. A bump is seen by every process within
+    that window.
+    """
+    local_cache = caches["local"]
+    generation = local_cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = cache.get_or_set(GENERATION_KEY, 1, timeout=None)
+        local_cache.set(
+            GENERATION_KEY,
+            generation,
+            timeout=getattr(settings, "ANALYTICS_GENERATION_CACHE_TIMEOUT", 5),
+        )
+    return generation
+
+
+def bump_generation() -> None:
+    """
+    Move analytics caches to a new generation after a batch of writes.
+
+    Called once per aggregation or refresh run rather than per ingested view,
+    so bursts of blog views do not churn the cache.
+    """
+    if not analytics_cache_enabled():
+        return
+    try:
+        generation = cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Key missing or evicted: any value other than the evicted one works
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.incr(GENERATION_KEY)
+    logger.info("Analytics cache generation is now %s", generation)
+
+
+# Bumped when the stored entry layout changes, so old entries are never unpacked
+ENTRY_FORMAT = 2
+
+
+def make_cache_key(prefix: str, params: Dict[str, Any]) -> str:
+    """Build a stable cache key from the prefix and a 128-bit BLAKE2b of the sorted params."""
+    payload = orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str)
+    return f"{prefix}:v{ENTRY_FORMAT}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+def cached_analytics(prefix: str, local: bool = False) -> Callable:
+    """
+    Cache a service function's result for ANALYTICS_CACHE_TIMEOUT seconds.
+
+    Positional and keyword arguments are normalized through the function
+    signature, so ``f("month")`` and ``f(compare="month")`` share a key.
+    With ``local=True`` the per-process "local" cache is checked first and
+    filled from shared cache hits and fresh results.
+
+    Shared entries store their expiry time next to the result, and a local
+    copy lives for the local TTL capped by what remains of the shared entry.
+    A result is therefore never served more than ANALYTICS_CACHE_TIMEOUT
+    seconds after it was computed, from either layer.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not analytics_cache_enabled():
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_cache_key(f"{prefix}:g{get_generation()}", bound.arguments)
+
+            local_cache = caches["local"] if local else None
+            if local_cache is not None:
+                result = local_cache.get(key)
+                if result is not None:
+                    logger.debug("Analytics local cache hit for %s", key)
+                    return result
+
+            entry = cache.get(key)
+            if entry is not None:
+                logger.debug("Analytics cache hit for %s", key)
+                expires_at, result = entry
+            else:
+                timeout = getattr(settings, "ANALYTICS_CACHE_TIMEOUT", 60)
+                result = func(*args, **kwargs)
+                expires_at = time.time() + timeout
+                cache.set(key, (expires_at, result), timeout=timeout)
+
+            if local_cache is not None:
+                remaining = expires_at - time.time()
+                local_timeout = getattr(settings, "ANALYTICS_LOCAL_CACHE_TIMEOUT", 60)
+                if remaining > 0:
+                    local_cache.set(key, result, timeout=min(local_timeout, remaining))
+            return result
+
+        return wrapper
+
+    return decorator
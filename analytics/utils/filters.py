@@ -1,13 +1,30 @@
 # analytics/utils/filters.py
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
 from django.db.models import Q
 
 
 FilterDict = Dict[str, Any]
 
 
+def has_meaningful_filters(filter_obj: Optional[FilterDict]) -> bool:
+    """
+    Return True when a filter object would actually constrain a queryset.
+
+    None, {} and trees whose operators all carry empty payloads
+    (e.g. {"and": []}) are treated as "no filters" so callers can skip
+    building a Q object entirely.
+    """
+    if not filter_obj:
+        return False
+    if not isinstance(filter_obj, dict):
+        return True
+    return any(filter_obj.values())
+
+
 def build_q_from_filter(filter_obj: FilterDict) -> Q:
     """
     Convert a filter object (JSON-friendly) into a Django Q object.
@@ -85,3 +102,24 @@ def build_q_from_filter(filter_obj: FilterDict) -> Q:
             return Q(**{lookup: value})
 
     raise ValueError(f"Unsupported filter: {filter_obj}")
+
+
+@lru_cache(maxsize=1024)
+def _q_from_filter_json(filter_json: bytes) -> Q:
+    return build_q_from_filter(orjson.loads(filter_json))
+
+
+def cached_q_from_filter(filter_obj: FilterDict) -> Q:
+    """
+    Memoized ``build_q_from_filter`` keyed by the canonical (sorted-key) JSON
+    of the filter tree, so dashboards polling the same filters skip the parse.
+
+    The returned Q is shared between callers: pass it to ``filter()`` or
+    combine it with ``&``/``|`` (which copy), but never mutate it in place.
+    """
+    try:
+        key = orjson.dumps(filter_obj, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # Not JSON-representable (orjson.JSONEncodeError): build it uncached
+        return build_q_from_filter(filter_obj)
+    return _q_from_filter_json(key)
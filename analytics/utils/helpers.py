@@ -1,10 +1,14 @@
 """
 Helper functions and constants shared across analytics views and services.
 """
-import json
+import logging
 from typing import Any
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
+import orjson
+from django.conf import settings
+from django.db import connection
 from django.http import QueryDict
+from django.utils import timezone
 from django.db.models import QuerySet
 from django.db.models.functions import TruncMonth, TruncWeek, TruncDay, TruncYear
 from config.logger import logger
@@ -19,6 +23,18 @@ TRUNC_MAP = {
 }
 
 
+def _to_date(value: Any) -> date:
+    """Normalize input (str | date | datetime) to a date object."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        # C-level ISO parser; strptime goes through a Python regex each call
+        return date.fromisoformat(value)
+    raise ValueError(f"Unsupported date type: {type(value)!r}")
+
+
 def detect_granularity(start: Any | None, end: Any | None) -> str:
     """
     Automatically detect the appropriate time granularity based on the date range.
@@ -41,16 +57,6 @@ def detect_granularity(start: Any | None, end: Any | None) -> str:
         logger.debug("Start or end date missing, defaulting to 'month' granularity")
         return "month"
 
-    def _to_date(value: Any) -> date:
-        """Normalize input (str | date | datetime) to a date object."""
-        if isinstance(value, datetime):
-            return value.date()
-        if isinstance(value, date):
-            return value
-        if isinstance(value, str):
-            return datetime.strptime(value, "%Y-%m-%d").date()
-        raise ValueError(f"Unsupported date type: {type(value)!r}")
-
     try:
         start_date = _to_date(start)
         end_date = _to_date(end)
@@ -68,25 +74,60 @@ def detect_granularity(start: Any | None, end: Any | None) -> str:
         else:
             granularity = "year"
         
-        logger.debug(f"Date range: {days_diff} days, detected granularity: {granularity}")
+        logger.debug("Date range: %s days, detected granularity: %s", days_diff, granularity)
         return granularity
     except ValueError as e:
         logger.warning(f"Invalid date format: {e}, defaulting to 'month' granularity")
         return "month"
 
 
-def parse_timerange(qs: QuerySet, start: str | None, end: str | None, datetime_field: str = "viewed_at") -> QuerySet:
+def parse_timerange(
+    qs: QuerySet,
+    start: str | date | None,
+    end: str | date | None,
+    datetime_field: str = "viewed_at",
+) -> QuerySet:
     """
     Apply a time range filter to a queryset. start/end should be ISO date strings
-    (YYYY-MM-DD) or None.
+    (YYYY-MM-DD), dates or None; both days are included.
+
+    Emitted as the half-open range ``field >= start AND field < end + 1 day``,
+    so the predicate stays a plain range on the indexed column. The requested
+    dates are never widened to the reporting bucket; bucketing only happens in
+    the GROUP BY.
     """
     if start:
-        qs = qs.filter(**{f"{datetime_field}__gte": start})
+        lower = datetime.combine(_to_date(start), time.min)
+        qs = qs.filter(**{f"{datetime_field}__gte": timezone.make_aware(lower)})
     if end:
-        qs = qs.filter(**{f"{datetime_field}__lte": end})
+        upper = datetime.combine(_to_date(end) + timedelta(days=1), time.min)
+        qs = qs.filter(**{f"{datetime_field}__lt": timezone.make_aware(upper)})
     return qs
 
 
+def materialized_views_enabled() -> bool:
+    """
+    Whether analytics may read the daily materialized view rollups.
+
+    The views only exist on PostgreSQL and can be switched off with
+    ANALYTICS_USE_MATERIALIZED_VIEWS.
+    """
+    return (
+        getattr(settings, "ANALYTICS_USE_MATERIALIZED_VIEWS", False)
+        and connection.vendor == "postgresql"
+    )
+
+
+def approx_distinct_enabled() -> bool:
+    """
+    Whether ranking queries may use HyperLogLog approximate distinct counts.
+
+    Needs the PostgreSQL ``hll`` extension, so it is opt-in through
+    ANALYTICS_USE_HLL.
+    """
+    return getattr(settings, "ANALYTICS_USE_HLL", False) and connection.vendor == "postgresql"
+
+
 def safe_int(value: Any, default: int = 0) -> int:
     """Safely convert a value to int, returning default if conversion fails."""
     try:
@@ -97,8 +138,8 @@ def safe_int(value: Any, default: int = 0) -> int:
 
 def parse_query_params(query_params: QueryDict) -> dict[str, Any]:
     """
-    Convert DRF QueryDict to a regular dict, handling list values,
-    empty strings, and JSON parsing for filters.
+    Convert DRF QueryDict to a regular dict, handling empty strings
+    and JSON parsing for filters.
     
     Args:
         query_params: QueryDict from request.query_params
@@ -106,28 +147,22 @@ def parse_query_params(query_params: QueryDict) -> dict[str, Any]:
     Returns:
         dict: Regular dictionary with parsed query parameters
     """
-    data = {}
-    for key, value in query_params.items():
-        logger.debug(f"Query parameter - Key: {key}, Value: {value}")
-        # QueryDict returns lists, get the first element
-        if isinstance(value, list):
-            value = value[0] if value else None
-        # Convert empty strings to None for optional fields
-        if value == "":
-            value = None
-        data[key] = value
+    # QueryDict.items() already yields the last value of each key as a string;
+    # empty strings become None for optional fields.
+    data = {key: (None if value == "" else value) for key, value in query_params.items()}
     
     # Parse filters from JSON string if provided
     if "filters" in data and data["filters"]:
         try:
             # Parse JSON string to dict
-            data["filters"] = json.loads(data["filters"])
-            logger.debug(f"Parsed filters: {data['filters']}")
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning(f"Failed to parse filters JSON: {e}")
+            data["filters"] = orjson.loads(data["filters"])
+        except (orjson.JSONDecodeError, TypeError) as e:
+            logger.warning("Failed to parse filters JSON: %s", e)
             # If it's not valid JSON, pass it as-is and let serializer handle validation
             pass
-    
-    logger.debug(f"Parsed query params: {data}")
+
+    # Single guarded log for the whole request instead of one record per step
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query params: %r parsed: %r", list(query_params.items()), data)
     return data
 
@@ -31,16 +31,27 @@ from analytics.serializers.blog_serializers import (
     BlogViewsAnalyticsResponseSerializer,
 )
 from analytics.pagination import ConfigurablePageNumberPagination
+from analytics.parsers import ORJSONParser
+from analytics.renderers import ORJSONRenderer
 from analytics.services.blog_services import BlogViewsAnalyticsService
+from analytics.utils.cache import get_generation
 from analytics.utils.helpers import parse_query_params
 from analytics.utils.swagger import SwaggerMixin, create_enum_parameter
 from config.logger import logger
 
+_RENDERERS = (ORJSONRenderer,)
+_PARSERS = (ORJSONParser,)
+
 
 class BlogViewsAnalyticsView(SwaggerMixin, APIView):
     """Analytics view for blog views grouped by country or user."""
     
     pagination_class = ConfigurablePageNumberPagination
+    renderer_classes = _RENDERERS
+    parser_classes = _PARSERS
+    authentication_classes = ()
+    permission_classes = ()
+    throttle_classes = ()
     
     # Swagger configuration
     swagger_operation_id = "blog_views_analytics"
@@ -68,14 +79,14 @@ class BlogViewsAnalyticsView(SwaggerMixin, APIView):
         """
         Handle GET requests using query parameters to retrieve blog views analytics.
         """
-        logger.info(f"Blog views analytics request received from {request.META.get('REMOTE_ADDR', 'unknown')}")
+        logger.info("Blog views analytics request received from %s", request.META.get('REMOTE_ADDR', 'unknown'))
 
         # Decide if we should use cache (disabled in tests by default)
         use_cache = getattr(settings, "USE_REDIS_CACHE", True) and not getattr(settings, "IS_TESTING", False)
 
         # Build a cache key based on full request path + query string
-        cache_key = f"blog_views_analytics:{request.get_full_path()}"
         if use_cache:
+            cache_key = f"blog_views_analytics:g{get_generation()}:{request.get_full_path()}"
             cached_payload = cache.get(cache_key)
             if cached_payload is not None:
                 logger.debug("Returning cached response for BlogViewsAnalyticsView")
@@ -86,7 +97,7 @@ class BlogViewsAnalyticsView(SwaggerMixin, APIView):
 
         serializer = BlogViewsAnalyticsRequestSerializer(data=data)
         if not serializer.is_valid():
-            logger.warning(f"Invalid request data: {serializer.errors}")
+            logger.warning("Invalid request data: %s", serializer.errors)
             serializer.is_valid(raise_exception=True)
 
         validated_data = serializer.validated_data
@@ -95,7 +106,7 @@ class BlogViewsAnalyticsView(SwaggerMixin, APIView):
         start = validated_data.get("start")
         end = validated_data.get("end")
 
-        logger.info(f"Fetching blog views analytics - object_type: {object_type}, start: {start}, end: {end}")
+        logger.info("Fetching blog views analytics - object_type: %s, start: %s, end: %s", object_type, start, end)
 
         # Use service to get analytics data
         try:
@@ -105,15 +116,15 @@ class BlogViewsAnalyticsView(SwaggerMixin, APIView):
                 start=start,
                 end=end,
             )
-            logger.info(f"Successfully retrieved {len(result)} analytics records")
+            logger.info("Successfully retrieved %d analytics records", len(result))
         except ValueError as e:
-            logger.error(f"Invalid filter format: {str(e)}")
+            logger.error("Invalid filter format: %s", e)
             return Response(
                 {"detail": f"Invalid filter format: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         except Exception as e:
-            logger.error(f"Unexpected error in blog views analytics: {str(e)}", exc_info=True)
+            logger.error("Unexpected error in blog views analytics: %s", e, exc_info=True)
             return Response(
                 {"detail": "An error occurred while processing your request"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -122,16 +133,15 @@ class BlogViewsAnalyticsView(SwaggerMixin, APIView):
         # Paginate results
         paginator = self.pagination_class()
         paginated_result = paginator.paginate_queryset(result, request)
-        response_serializer = BlogViewsAnalyticsResponseSerializer(paginated_result, many=True)
-        response = paginator.get_paginated_response(response_serializer.data)
+        response = paginator.get_paginated_response(paginated_result)
 
         # Cache the final paginated payload (only when cache is enabled)
         if use_cache:
             cache_timeout = getattr(settings, "BLOG_VIEWS_ANALYTICS_CACHE_TIMEOUT", 300)
             cache.set(cache_key, response.data, timeout=cache_timeout)
-            logger.debug(f"Returning paginated response with {len(paginated_result)} items (cached for {cache_timeout}s)")
+            logger.debug("Returning paginated response with %d items (cached for %ss)", len(paginated_result), cache_timeout)
         else:
-            logger.debug(f"Returning paginated response with {len(paginated_result)} items (cache disabled)")
+            logger.debug("Returning paginated response with %d items (cache disabled)", len(paginated_result))
         return response
 
 
@@ -23,16 +23,26 @@ from analytics.serializers.performance_serializers import (
     PerformanceAnalyticsResponseSerializer,
 )
 from analytics.pagination import ConfigurablePageNumberPagination
+from analytics.parsers import ORJSONParser
+from analytics.renderers import ORJSONRenderer
 from analytics.services.performance_service import PerformanceAnalyticsService
 from analytics.utils.helpers import parse_query_params
 from analytics.utils.swagger import SwaggerMixin, create_enum_parameter, create_integer_parameter
 from config.logger import logger
 
+_RENDERERS = (ORJSONRenderer,)
+_PARSERS = (ORJSONParser,)
+
 
 class PerformanceAnalyticsView(SwaggerMixin, APIView):
     """Analytics view for performance metrics over time periods."""
     
     pagination_class = ConfigurablePageNumberPagination
+    renderer_classes = _RENDERERS
+    parser_classes = _PARSERS
+    authentication_classes = ()
+    permission_classes = ()
+    throttle_classes = ()
     
     # Swagger configuration
     swagger_operation_id = "performance_analytics"
@@ -65,14 +75,14 @@ class PerformanceAnalyticsView(SwaggerMixin, APIView):
         """
         Handle GET requests using query parameters to retrieve performance analytics.
         """
-        logger.info(f"Performance analytics request received from {request.META.get('REMOTE_ADDR', 'unknown')}")
+        logger.info("Performance analytics request received from %s", request.META.get('REMOTE_ADDR', 'unknown'))
         
         # Parse query parameters using helper function
         data = parse_query_params(request.query_params)
         
         serializer = PerformanceAnalyticsRequestSerializer(data=data)
         if not serializer.is_valid():
-            logger.warning(f"Invalid request data: {serializer.errors}")
+            logger.warning("Invalid request data: %s", serializer.errors)
             serializer.is_valid(raise_exception=True)
         
         validated_data = serializer.validated_data
@@ -82,21 +92,27 @@ class PerformanceAnalyticsView(SwaggerMixin, APIView):
         start = validated_data.get("start")
         end = validated_data.get("end")
 
-        logger.info(f"Fetching performance analytics - compare: {compare}, user_id: {user_id}, start: {start}, end: {end}")
+        logger.info("Fetching performance analytics - compare: %s, user_id: %s, start: %s, end: %s", compare, user_id, start, end)
+
+        # Page in the database: only the requested page of periods is fetched
+        paginator = self.pagination_class()
+        limit, offset = paginator.get_limit_offset(request)
 
         try:
             # Use service to get performance analytics data
-            result = PerformanceAnalyticsService.get_performance_analytics(
+            result, count = PerformanceAnalyticsService.get_performance_page(
                 compare=compare,
                 filters=filters,
                 user_id=user_id,
                 start=start,
                 end=end,
+                limit=limit,
+                offset=offset,
             )
-            logger.info(f"Successfully retrieved {len(result)} performance analytics records")
+            logger.info("Retrieved %d of %d performance analytics records", len(result), count)
         except ValueError as e:
             error_message = str(e)
-            logger.error(f"Invalid parameter in performance analytics: {error_message}")
+            logger.error("Invalid parameter in performance analytics: %s", error_message)
             # Check if it's a filter validation error
             if "filter" in error_message.lower() or "Unsupported filter" in error_message:
                 return Response(
@@ -108,18 +124,15 @@ class PerformanceAnalyticsView(SwaggerMixin, APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Unexpected error in performance analytics: {str(e)}", exc_info=True)
+            logger.error("Unexpected error in performance analytics: %s", e, exc_info=True)
             return Response(
                 {"detail": "An error occurred while processing your request"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
-        # Paginate results
-        paginator = self.pagination_class()
-        paginated_result = paginator.paginate_queryset(result, request)
-        response_serializer = PerformanceAnalyticsResponseSerializer(paginated_result, many=True)
-        logger.debug(f"Returning paginated response with {len(paginated_result)} items")
-        return paginator.get_paginated_response(response_serializer.data)
+        paginated_result = paginator.paginate_counted(result, count, request)
+        logger.debug("Returning paginated response with %d items", len(paginated_result))
+        return paginator.get_paginated_response(paginated_result)
 
 
 # Apply Swagger schema decorator to the get method
@@ -5,29 +5,72 @@ Endpoint: /analytics/top/
 - top: 'user'|'country'|'blog'
 - time range fields: start, end (ISO)
 - filters: dynamic filter tree
+- limit, after: page size and keyset cursor (next_cursor of the previous page)
 Returns top 10 by total views. x,y,z vary per 'top' selection.
 """
+import hashlib
+
+import orjson
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from drf_spectacular.utils import OpenApiParameter
 
 from analytics.serializers.top_serializers import (
+    TopAnalyticsRequest,
     TopAnalyticsRequestSerializer,
     TopAnalyticsResponseSerializer,
 )
-from analytics.pagination import ConfigurablePageNumberPagination
+from analytics.pagination import KeysetPagination
+from analytics.parsers import ORJSONParser
+from analytics.renderers import ORJSONRenderer
 from analytics.services.top_service import TopAnalyticsService
 from analytics.utils.helpers import parse_query_params
-from analytics.utils.swagger import SwaggerMixin, create_enum_parameter, create_integer_parameter
+from analytics.utils.swagger import (
+    SwaggerMixin,
+    create_enum_parameter,
+    create_integer_parameter,
+    create_string_parameter,
+    get_date_range_parameters,
+)
 from config.logger import logger
 
+_RENDERERS = (ORJSONRenderer,)
+_PARSERS = (ORJSONParser,)
+
+# Dashboards poll the same rankings; let them revalidate instead of refetching
+_CLIENT_MAX_AGE = 30
+
+
+def _conditional_response(request: Request, response: Response) -> Response:
+    """
+    Tag a 200 response with a strong ETag over its payload and answer a
+    matching If-None-Match with an empty 304.
+    """
+    payload = orjson.dumps(response.data, option=orjson.OPT_SORT_KEYS, default=str)
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, max_age=_CLIENT_MAX_AGE)
+    return response
+
 
 class TopAnalyticsView(SwaggerMixin, APIView):
     """Analytics view for top 10 users, countries, or blogs by views."""
     
-    pagination_class = ConfigurablePageNumberPagination
+    pagination_class = KeysetPagination
+    renderer_classes = _RENDERERS
+    parser_classes = _PARSERS
+    authentication_classes = ()
+    permission_classes = ()
+    throttle_classes = ()
     
     # Swagger configuration
     swagger_operation_id = "top_analytics"
@@ -41,7 +84,8 @@ class TopAnalyticsView(SwaggerMixin, APIView):
     
     def get_swagger_parameters(self):
         """Get Swagger parameters including view-specific ones."""
-        return self.get_common_parameters() + [
+        # Keyset paginated: limit/after replace the page/page_size parameters
+        return get_date_range_parameters() + [
             create_enum_parameter(
                 name="top",
                 description="The type of top analytics to retrieve",
@@ -50,7 +94,12 @@ class TopAnalyticsView(SwaggerMixin, APIView):
             ),
             create_integer_parameter(
                 name="limit",
-                description="The number of top results to return",
+                description="The number of top results to return (1-100, default 10)",
+                required=False,
+            ),
+            create_string_parameter(
+                name="after",
+                description="Cursor for the next page, taken from next_cursor",
                 required=False,
             ),
         ]
@@ -59,23 +108,25 @@ class TopAnalyticsView(SwaggerMixin, APIView):
         """
         Handle GET requests using query parameters to retrieve top analytics.
         """
-        logger.info(f"Top analytics request received from {request.META.get('REMOTE_ADDR', 'unknown')}")
+        logger.info("Top analytics request received from %s", request.META.get('REMOTE_ADDR', 'unknown'))
         
         # Parse query parameters using helper function
         data = parse_query_params(request.query_params)
         
-        serializer = TopAnalyticsRequestSerializer(data=data)
-        if not serializer.is_valid():
-            logger.warning(f"Invalid request data: {serializer.errors}")
-            serializer.is_valid(raise_exception=True)
-        
-        validated_data = serializer.validated_data
-        top = validated_data.get("top", "blog")
-        filters = validated_data.get("filters")
-        start = validated_data.get("start")
-        end = validated_data.get("end")
+        try:
+            params = TopAnalyticsRequest.from_data(data)
+        except ValidationError as e:
+            logger.warning("Invalid request data: %s", e.detail)
+            raise
+
+        top = params.top
+        filters = params.filters
+        start = params.start
+        end = params.end
+        limit = params.limit
+        after = params.after
 
-        logger.info(f"Fetching top analytics - top: {top}, start: {start}, end: {end}")
+        logger.info("Fetching top analytics - top: %s, start: %s, end: %s", top, start, end)
 
         # Use service to get top analytics data
         try:
@@ -84,17 +135,19 @@ class TopAnalyticsView(SwaggerMixin, APIView):
                 filters=filters,
                 start=start,
                 end=end,
-                limit=10,
+                # One look-ahead row tells whether there is a next page
+                limit=limit + 1,
+                after=after,
             )
-            logger.info(f"Successfully retrieved {len(result)} top analytics records")
+            logger.info("Successfully retrieved %d top analytics records", len(result))
         except ValueError as e:
-            logger.error(f"Invalid filter format: {str(e)}")
+            logger.error("Invalid filter format: %s", e)
             return Response(
                 {"detail": f"Invalid filter format: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Unexpected error in top analytics: {str(e)}", exc_info=True)
+            logger.error("Unexpected error in top analytics: %s", e, exc_info=True)
             return Response(
                 {"detail": "An error occurred while processing your request"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -102,10 +155,11 @@ class TopAnalyticsView(SwaggerMixin, APIView):
         
         # Paginate results
         paginator = self.pagination_class()
-        paginated_result = paginator.paginate_queryset(result, request)
-        response_serializer = TopAnalyticsResponseSerializer(paginated_result, many=True)
-        logger.debug(f"Returning paginated response with {len(paginated_result)} items")
-        return paginator.get_paginated_response(response_serializer.data)
+        page = paginator.paginate_rows(result, limit, request)
+        position = TopAnalyticsService.cursor_position(top, page[-1]) if page else None
+        logger.debug("Returning paginated response with %d items", len(page))
+        response = paginator.get_paginated_response(page, paginator.get_next_cursor(position))
+        return _conditional_response(request, response)
 
 
 # Apply Swagger schema decorator to the get method
@@ -1,9 +1,11 @@
+import functools
 import os
 import pathlib
 from environ import Env
-from config.logger import logger
-# Build paths inside the project
-BASE_DIR = pathlib.Path(__file__).resolve().parent.parent.parent
+# Build paths inside the project. Deployments can pin the project root with
+# the BASE_DIR environment variable (the Docker image does) so it is not
+# resolved from the module path in every process.
+BASE_DIR = pathlib.Path(os.environ.get("BASE_DIR") or pathlib.Path(__file__).resolve().parents[2])
 
 # Initialize environ.Env
 env = Env(
@@ -16,9 +18,14 @@ if os.path.exists(env_file):
     Env.read_env(env_file)
 
 
+@functools.lru_cache(maxsize=256)
 def get_secret(secret_id, backup=None):
     """
     Get secret from environment variables.
+
+    Results are memoized per (secret_id, backup): the environment is read once
+    per process, so changing a variable requires a restart (as it already did
+    for settings). Backups must be hashable.
     
     Args:
         secret_id: The name of the environment variable to retrieve
@@ -29,9 +36,7 @@ def get_secret(secret_id, backup=None):
     """
     try:
         # Try to get the value from environment
-        value = env(secret_id, default=backup)
-        logger.info(f"Secret {secret_id} retrieved: {value}")
-        return value
+        return env(secret_id, default=backup)
     except Exception as e:
         # If there's an error, return backup or None
         return backup
@@ -39,7 +44,6 @@ def get_secret(secret_id, backup=None):
 
 # Determine which settings to load based on PIPELINE environment variable
 PIPELINE = get_secret("PIPELINE", "local")
-print("PIPELINE", PIPELINE)
 
 if PIPELINE == "production":
     from .production import *
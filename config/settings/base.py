@@ -1,9 +1,10 @@
+import importlib.util
 import os
 import sys
-from pathlib import Path
-from config.settings import get_secret
+from config.settings import BASE_DIR as PROJECT_DIR, get_secret
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
+# Derived from the project root computed once in config.settings.
+BASE_DIR = PROJECT_DIR / "config"
 
 
 # Quick-start development settings - unsuitable for production
@@ -31,12 +32,18 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     # Third-party apps
     "rest_framework",
-    "drf_spectacular",
     "django_celery_beat",
     # Local apps
     "analytics",
 ]
 
+# drf-spectacular only serves the OpenAPI schema/UI and has no models, so
+# processes that never serve HTTP (Celery worker and beat) set
+# DISABLE_API_SCHEMA to skip loading it.
+DISABLE_API_SCHEMA = str(get_secret("DISABLE_API_SCHEMA", "false")).lower() in {"1", "true", "yes"}
+if not DISABLE_API_SCHEMA:
+    INSTALLED_APPS.insert(INSTALLED_APPS.index("django_celery_beat"), "drf_spectacular")
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -77,6 +84,12 @@ DATABASES = {
     }
 }
 
+# Persistent PostgreSQL connections: reuse a worker's connection for up to
+# DB_CONN_MAX_AGE seconds instead of reconnecting on every request, and check
+# it is still alive before reuse.
+DB_CONN_MAX_AGE = int(get_secret("DB_CONN_MAX_AGE", backup=300))
+DB_CONN_HEALTH_CHECKS = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -136,16 +149,22 @@ REST_FRAMEWORK = {
     "VERSION_PARAM": "version",
     "DEFAULT_PAGINATION_CLASS": "analytics.pagination.ConfigurablePageNumberPagination",
     "PAGE_SIZE": API_PAGE_SIZE,
+    # orjson-backed JSON output for every API view, not just the analytics ones
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "analytics.renderers.ORJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "analytics.parsers.ORJSONParser",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
 # drf-spectacular settings
+# OpenAPI schema generated at image build time (manage.py spectacular); when
+# the file exists and DEBUG is off, /api/schema/ serves it instead of
+# regenerating it per request.
+API_SCHEMA_FILE = get_secret("API_SCHEMA_FILE", backup="")
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Zemenay Analytics API",
     "DESCRIPTION": "Analytics API for blog views, top analytics, and performance metrics",
@@ -174,12 +193,11 @@ SPECTACULAR_SETTINGS = {
 }
 
 # Logging configuration with colored output (if colorlog is available)
-# Check if colorlog is available
-try:
-    import colorlog
-    COLORLOG_AVAILABLE = True
-except ImportError:
-    COLORLOG_AVAILABLE = False
+# Colored console output can be switched off with USE_COLORLOG (e.g. for
+# production log collectors). Availability is checked without importing
+# colorlog; logging.config imports it only if the "colored" formatter is built.
+USE_COLORLOG = str(get_secret("USE_COLORLOG", "true")).lower() in {"1", "true", "yes"}
+COLORLOG_AVAILABLE = USE_COLORLOG and importlib.util.find_spec("colorlog") is not None
 
 # Build formatters based on colorlog availability
 formatters = {
@@ -314,6 +332,25 @@ IS_TESTING = any("pytest" in arg for arg in sys.argv)
 default_cache_flag = "false" if IS_TESTING else "true"
 USE_REDIS_CACHE = str(get_secret("USE_REDIS_CACHE", default_cache_flag)).lower() in {"1", "true", "yes"}
 
+# Per-process LRU + TTL layer in front of the shared cache for the hottest
+# analytics results (repeated dashboard queries), saving the Redis round trip.
+ANALYTICS_LOCAL_CACHE_TIMEOUT = int(
+    get_secret("ANALYTICS_LOCAL_CACHE_TIMEOUT", backup=60)
+)
+# How long each process reuses the analytics data generation before
+# re-reading it from the shared cache (see analytics.utils.cache).
+ANALYTICS_GENERATION_CACHE_TIMEOUT = int(
+    get_secret("ANALYTICS_GENERATION_CACHE_TIMEOUT", backup=5)
+)
+ANALYTICS_LOCAL_CACHE = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "analytics-hot",
+    "TIMEOUT": ANALYTICS_LOCAL_CACHE_TIMEOUT,
+    "OPTIONS": {
+        "MAX_ENTRIES": 1024,
+    },
+}
+
 if USE_REDIS_CACHE:
     CACHES = {
         "default": {
@@ -325,7 +362,8 @@ if USE_REDIS_CACHE:
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
             },
-        }
+        },
+        "local": ANALYTICS_LOCAL_CACHE,
     }
 else:
     # Local in‑memory cache (no external Redis required)
@@ -333,10 +371,29 @@ else:
         "default": {
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "analytics-local",
-        }
+        },
+        "local": ANALYTICS_LOCAL_CACHE,
     }
 
 # Cache timeout (in seconds) for blog views analytics endpoint
 BLOG_VIEWS_ANALYTICS_CACHE_TIMEOUT = int(
     get_secret("BLOG_VIEWS_ANALYTICS_CACHE_TIMEOUT", backup=300)
 )
+
+# Cache timeout (in seconds) for performance and top analytics service results.
+# Kept well below the materialized view refresh interval.
+ANALYTICS_CACHE_TIMEOUT = int(
+    get_secret("ANALYTICS_CACHE_TIMEOUT", backup=60)
+)
+
+# Materialized views (PostgreSQL only)
+# Unfiltered blog views analytics read pre-aggregated daily rollups refreshed by Celery beat.
+# Disabled under pytest by default since the views are only refreshed periodically.
+default_mv_flag = "false" if IS_TESTING else "true"
+ANALYTICS_USE_MATERIALIZED_VIEWS = str(
+    get_secret("ANALYTICS_USE_MATERIALIZED_VIEWS", default_mv_flag)
+).lower() in {"1", "true", "yes"}
+
+# Approximate distinct counts (HyperLogLog) for top analytics rankings.
+# Requires the PostgreSQL "hll" extension, so it is off unless enabled explicitly.
+ANALYTICS_USE_HLL = str(get_secret("ANALYTICS_USE_HLL", "false")).lower() in {"1", "true", "yes"}
@@ -24,11 +24,8 @@ else:
     DB_HOST = get_secret("DB_HOST", "db")  # Default to 'db' for docker-compose service name
     DB_PORT = get_secret("DB_PORT", "5432")
 
-    logger.info(f"DB_NAME: {DB_NAME}")
-    logger.info(f"DB_USER: {DB_USER}")
-    logger.info(f"DB_PASSWORD: {DB_PASSWORD}")
-    logger.info(f"DB_HOST: {DB_HOST}")
-    logger.info(f"DB_PORT: {DB_PORT}")
+    # Connection target only; never log the password
+    logger.debug("Database %s as %s on %s:%s", DB_NAME, DB_USER, DB_HOST, DB_PORT)
 
     if DB_NAME and DB_USER and DB_PASSWORD:
         DATABASES = {
@@ -39,6 +36,8 @@ else:
                 "PASSWORD": DB_PASSWORD,
                 "HOST": DB_HOST,
                 "PORT": DB_PORT,
+                "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+                "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
             }
         }
     else:
@@ -6,4 +6,7 @@ import os
 # Set default environment variable for settings
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 os.environ.setdefault('PIPELINE', 'local')
+# Run tests on in-memory SQLite unless a run opts out explicitly
+# (USE_IN_MEMORY_DB=0, e.g. to exercise PostgreSQL-only paths)
+os.environ.setdefault('USE_IN_MEMORY_DB', '1')
 